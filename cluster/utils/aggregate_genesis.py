@@ -1,32 +1,72 @@
+import functools
 import ipaddress
 import json
 import os
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Keys every identity sidecar must provide for a genesis validator entry.
+REQUIRED_IDENTITY_KEYS = frozenset(('account_address', 'consensus_public_key', 'network_public_key'))
+
+# Consensus PoP fallback when neither the node config nor the identity file
+# has one: ValidatorManagement.sol requires a non-empty consensusPop, so a
+# 96-byte dummy is used.
+DUMMY_POP = "0x" + "00" * 96
+
 def parse_simple_yaml(path):
     """
     Parses a simple key: value YAML file.
     Assumes no nesting and standard formatting from gravity_cli.
     """
     data = {}
-    with open(path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                # Remove quotes if present
-                if (value.startswith('"') and value.endswith('"')) or \
-                   (value.startswith("'") and value.endswith("'")):
-                    value = value[1:-1]
-                data[key] = value
+    with open(path, 'rb') as f:
+        text = f.read().decode()
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        value = value.strip()
+        # Remove quotes if present
+        if value[:1] in ('"', "'") and value[-1:] == value[:1]:
+            value = value[1:-1]
+        data[key.strip()] = value
     return data
 
+# Identity sidecars under <node_dir>/config, in lookup order: the public-only
+# sidecar written by init.sh first, then the legacy full identity file.
+IDENTITY_FILE_NAMES = ("identity.public.yaml", "identity.yaml")
+
+def identity_candidates(node_dir):
+    """Paths of the identity files to try for a node, in lookup order."""
+    config_dir = os.path.join(node_dir, "config")
+    return [os.path.join(config_dir, name) for name in IDENTITY_FILE_NAMES]
+
+def load_identity(candidates):
+    """
+    Returns (path, parsed identity) for the first candidate that exists, or
+    (None, None) if there is none. Shared by validator and shadow node lookups.
+    Candidates are opened directly rather than stat'ed first.
+    """
+    for path in candidates:
+        try:
+            return path, parse_simple_yaml(path)
+        except FileNotFoundError:
+            continue
+    return None, None
+
+@functools.lru_cache(maxsize=1)
 def get_genesis_defaults():
-    """Returns default genesis configuration values."""
+    """
+    Returns default genesis configuration values.
+    The dict is built once and shared between calls; treat it as read-only.
+    """
     return {
         "chainId": 1337,  # Default value, can be overridden in genesis.toml
         "epochIntervalMicros": 7200000000,
@@ -93,27 +133,90 @@ def get_genesis_defaults():
         }
     }
 
+# (camelCase output key, snake_case genesis.toml key) pairs, in output order.
+TOP_LEVEL_FIELDS = (
+    ("chainId", "chain_id"),
+    ("epochIntervalMicros", "epoch_interval_micros"),
+    ("majorVersion", "major_version"),
+    ("consensusConfig", "consensus_config"),
+    ("executionConfig", "execution_config"),
+    ("initialLockedUntilMicros", "initial_locked_until_micros"),
+    # Genesis EVM block.timestamp — required by genesis-tool for reproducible
+    # genesis.json output. Always emitted; falls back to the deterministic
+    # default constant when not set per-suite in genesis.toml.
+    ("genesisTimestampSecs", "genesis_timestamp_secs"),
+)
+
+VALIDATOR_CONFIG_FIELDS = (
+    ("minimumBond", "minimum_bond"),
+    ("maximumBond", "maximum_bond"),
+    ("unbondingDelayMicros", "unbonding_delay_micros"),
+    ("allowValidatorSetChange", "allow_validator_set_change"),
+    ("votingPowerIncreaseLimitPct", "voting_power_increase_limit_pct"),
+    ("maxValidatorSetSize", "max_validator_set_size"),
+    ("autoEvictEnabled", "auto_evict_enabled"),
+    ("autoEvictThresholdPct", "auto_evict_threshold_pct"),
+)
+
+STAKING_CONFIG_FIELDS = (
+    ("minimumStake", "minimum_stake"),
+    ("lockupDurationMicros", "lockup_duration_micros"),
+    ("unbondingDelayMicros", "unbonding_delay_micros"),
+)
+
+GOVERNANCE_CONFIG_FIELDS = (
+    ("minVotingThreshold", "min_voting_threshold"),
+    ("requiredProposerStake", "required_proposer_stake"),
+    ("votingDurationMicros", "voting_duration_micros"),
+)
+
+RANDOMNESS_CONFIG_V2_FIELDS = (
+    ("secrecyThreshold", "secrecy_threshold"),
+    ("reconstructionThreshold", "reconstruction_threshold"),
+    ("fastPathSecrecyThreshold", "fast_path_secrecy_threshold"),
+)
+
+def merge_fields(src, section_defaults, fields):
+    """
+    Overlay the snake_case overrides in src onto a camelCase defaults section.
+    section_defaults must hold exactly the keys listed in fields.
+    """
+    return section_defaults | {dst_key: src[src_key] for dst_key, src_key in fields if src_key in src}
+
+def write_json(path, obj):
+    """Atomically write obj as indented JSON (orjson if available, stdlib otherwise)."""
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except (orjson.JSONEncodeError, TypeError):
+            # orjson cannot encode ints beyond 64 bits (wei amounts can be)
+            data = None
+    if data is None:
+        data = json.dumps(obj, indent=2).encode()
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a partial temp file next to the output
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def build_genesis_config(config, genesis_cfg):
     """Build genesis config from cluster config, using defaults where not specified."""
     defaults = get_genesis_defaults()
     
-    # Override with values from cluster.toml if present
-    result = {}
-    
-    # Top-level fields
-    result["chainId"] = genesis_cfg.get("chain_id", defaults["chainId"])
-    result["epochIntervalMicros"] = genesis_cfg.get("epoch_interval_micros", defaults["epochIntervalMicros"])
-    result["majorVersion"] = genesis_cfg.get("major_version", defaults["majorVersion"])
-    result["consensusConfig"] = genesis_cfg.get("consensus_config", defaults["consensusConfig"])
-    result["executionConfig"] = genesis_cfg.get("execution_config", defaults["executionConfig"])
-    result["initialLockedUntilMicros"] = genesis_cfg.get("initial_locked_until_micros", defaults["initialLockedUntilMicros"])
-
-    # Genesis EVM block.timestamp — required by genesis-tool for reproducible
-    # genesis.json output. Always emitted; falls back to the deterministic
-    # default constant when not set per-suite in genesis.toml.
-    result["genesisTimestampSecs"] = genesis_cfg.get(
-        "genesis_timestamp_secs", defaults["genesisTimestampSecs"]
-    )
+    # Override with values from cluster.toml if present, starting with the
+    # top-level fields
+    result = {
+        dst_key: genesis_cfg[src_key] if src_key in genesis_cfg else defaults[dst_key]
+        for dst_key, src_key in TOP_LEVEL_FIELDS
+    }
 
     # governanceOwner is now a required field in genesis-tool's GenesisConfig
     # (contracts main commit 57ae9bc wires Governance.owner at genesis via
@@ -129,42 +232,23 @@ def build_genesis_config(config, genesis_cfg):
 
     # validatorConfig
     vc = genesis_cfg.get("validator_config", {})
-    result["validatorConfig"] = {
-        "minimumBond": vc.get("minimum_bond", defaults["validatorConfig"]["minimumBond"]),
-        "maximumBond": vc.get("maximum_bond", defaults["validatorConfig"]["maximumBond"]),
-        "unbondingDelayMicros": vc.get("unbonding_delay_micros", defaults["validatorConfig"]["unbondingDelayMicros"]),
-        "allowValidatorSetChange": vc.get("allow_validator_set_change", defaults["validatorConfig"]["allowValidatorSetChange"]),
-        "votingPowerIncreaseLimitPct": vc.get("voting_power_increase_limit_pct", defaults["validatorConfig"]["votingPowerIncreaseLimitPct"]),
-        "maxValidatorSetSize": vc.get("max_validator_set_size", defaults["validatorConfig"]["maxValidatorSetSize"]),
-        "autoEvictEnabled": vc.get("auto_evict_enabled", defaults["validatorConfig"]["autoEvictEnabled"]),
-        "autoEvictThresholdPct": int(vc.get("auto_evict_threshold_pct", defaults["validatorConfig"]["autoEvictThresholdPct"]))
-    }
-    
+    result["validatorConfig"] = merge_fields(vc, defaults["validatorConfig"], VALIDATOR_CONFIG_FIELDS)
+    result["validatorConfig"]["autoEvictThresholdPct"] = int(result["validatorConfig"]["autoEvictThresholdPct"])
+
     # stakingConfig
     sc = genesis_cfg.get("staking_config", {})
-    result["stakingConfig"] = {
-        "minimumStake": sc.get("minimum_stake", defaults["stakingConfig"]["minimumStake"]),
-        "lockupDurationMicros": sc.get("lockup_duration_micros", defaults["stakingConfig"]["lockupDurationMicros"]),
-        "unbondingDelayMicros": sc.get("unbonding_delay_micros", defaults["stakingConfig"]["unbondingDelayMicros"])
-    }
-    
+    result["stakingConfig"] = merge_fields(sc, defaults["stakingConfig"], STAKING_CONFIG_FIELDS)
+
     # governanceConfig
     gc = genesis_cfg.get("governance_config", {})
-    result["governanceConfig"] = {
-        "minVotingThreshold": gc.get("min_voting_threshold", defaults["governanceConfig"]["minVotingThreshold"]),
-        "requiredProposerStake": gc.get("required_proposer_stake", defaults["governanceConfig"]["requiredProposerStake"]),
-        "votingDurationMicros": gc.get("voting_duration_micros", defaults["governanceConfig"]["votingDurationMicros"])
-    }
+    result["governanceConfig"] = merge_fields(gc, defaults["governanceConfig"], GOVERNANCE_CONFIG_FIELDS)
 
     # randomnessConfig
     rc = genesis_cfg.get("randomness_config", {})
+    rc_def = defaults["randomnessConfig"]
     result["randomnessConfig"] = {
-        "variant": rc.get("variant", defaults["randomnessConfig"]["variant"]),
-        "configV2": {
-            "secrecyThreshold": rc.get("secrecy_threshold", defaults["randomnessConfig"]["configV2"]["secrecyThreshold"]),
-            "reconstructionThreshold": rc.get("reconstruction_threshold", defaults["randomnessConfig"]["configV2"]["reconstructionThreshold"]),
-            "fastPathSecrecyThreshold": rc.get("fast_path_secrecy_threshold", defaults["randomnessConfig"]["configV2"]["fastPathSecrecyThreshold"])
-        }
+        "variant": rc.get("variant", rc_def["variant"]),
+        "configV2": merge_fields(rc, rc_def["configV2"], RANDOMNESS_CONFIG_V2_FIELDS)
     }
     
     # oracleConfig
@@ -247,32 +331,41 @@ def main():
 
     shadow_lookup = {sn['id']: sn for sn in config.get('shadow_nodes', [])}
 
-    validators = []
+    # Optional pre-aggregated identities ({node_id: {account_address, ...}}),
+    # so CI can skip reading every node's identity sidecar.
+    identity_json_path = os.environ.get('GRAVITY_IDENTITY_JSON')
+    preloaded_identities = {}
+    if identity_json_path:
+        with open(identity_json_path) as f:
+            preloaded_identities = json.load(f)
+
+    # Every node either yields an entry or aborts the run, so the list is
+    # sized up front and filled by index.
+    validators = [None] * len(genesis_nodes)
 
-    for node in genesis_nodes:
+    for i, node in enumerate(genesis_nodes):
         node_id = node['id']
-        data_dir = node.get('data_dir') or os.path.join(output_dir, node_id)
-        public_path = os.path.join(data_dir, "config", "identity.public.yaml")
-        legacy_path = os.path.join(data_dir, "config", "identity.yaml")
-
-        if os.path.exists(public_path):
-            identity_path = public_path
-        elif os.path.exists(legacy_path):
-            identity_path = legacy_path
+        # Identity source, first match wins: keys given inline on the
+        # genesis_validators entry, GRAVITY_IDENTITY_JSON, the node's sidecar.
+        if REQUIRED_IDENTITY_KEYS <= node.keys():
+            identity_path, identity = f"genesis_validators entry '{node_id}'", node
+        elif node_id in preloaded_identities:
+            identity_path, identity = identity_json_path, preloaded_identities[node_id]
         else:
-            print(f"Error: Identity file not found: tried {public_path} and {legacy_path}")
-            print("Run 'make init' first to generate node keys.")
-            sys.exit(1)
-
-        identity = parse_simple_yaml(identity_path)
+            data_dir = node.get('data_dir') or os.path.join(output_dir, node_id)
+            candidates = identity_candidates(data_dir)
+            identity_path, identity = load_identity(candidates)
+            if identity_path is None:
+                print(f"Error: Identity file not found: tried {' and '.join(candidates)}")
+                print("Run 'make init' first to generate node keys.")
+                sys.exit(1)
 
         # Validation
-        required_keys = ['account_address', 'consensus_public_key', 'network_public_key']
-        for k in required_keys:
-            if k not in identity:
-                print(f"Error: Missing '{k}' in {public_path}")
-                print("Re-run 'make init' to regenerate the sidecar.")
-                sys.exit(1)
+        missing = REQUIRED_IDENTITY_KEYS - identity.keys()
+        if missing:
+            print(f"Error: Missing {', '.join(repr(k) for k in sorted(missing))} in {identity_path}")
+            print("Re-run 'make init' to regenerate the sidecar.")
+            sys.exit(1)
         
         # Get validator address from config (required)
         val_addr = node.get('address')
@@ -294,7 +387,7 @@ def main():
             ('owner_address', owner_address),
             ('staker_address', staker_address),
         ):
-            if not addr.startswith('0x') or len(addr) != 42:
+            if len(addr) != 42 or addr[:2] != '0x':
                 print(f"Error: Node {node_id}: {label} must be 0x-prefixed 20-byte ETH address")
                 sys.exit(1)
         
@@ -309,17 +402,24 @@ def main():
             print(f"Error: Node {node_id} must specify 'voting_power' in genesis.toml")
             sys.exit(1)
         
-        # Validate voting_power >= stake_amount
-        if int(voting_power) < int(stake_amount):
+        # Validate voting_power >= stake_amount. Both are parsed once; the
+        # output keeps the original decimal strings.
+        try:
+            voting_power_wei = int(voting_power)
+            stake_amount_wei = int(stake_amount)
+        except ValueError:
+            print(f"Error: Node {node_id}: stake_amount and voting_power must be integer amounts in wei")
+            sys.exit(1)
+        if voting_power_wei < stake_amount_wei:
             print(f"Error: Node {node_id}: voting_power ({voting_power}) must be >= stake_amount ({stake_amount})")
             sys.exit(1)
             
         consensus_pk = identity['consensus_public_key']
-        if not consensus_pk.startswith('0x'):
+        if consensus_pk[:2] != '0x':
             consensus_pk = f"0x{consensus_pk}"
             
         network_pk = identity['network_public_key']
-        if network_pk.startswith('0x'):
+        if network_pk[:2] == '0x':
             network_pk = network_pk[2:]
 
         # Network info
@@ -335,15 +435,16 @@ def main():
             raise KeyError(f"{node_id}: missing validator_port (or deprecated p2p_port)")
         vfn_port = node['vfn_port']
 
-        # Build addresses: use /dns/ for domain names, /ip4/ for IPv4 addresses
+        # Build addresses: use /dns/ for domain names, /ip4/ for IPv4 addresses.
+        # Both addresses share the host prefix and the noise handshake suffix.
         try:
-            import ipaddress
             ipaddress.IPv4Address(host)
-            host_proto = "ip4"
+            host_prefix = f"/ip4/{host}/tcp/"
         except ValueError:
-            host_proto = "dns"
+            host_prefix = f"/dns/{host}/tcp/"
+        noise_suffix = "/noise-ik/" + network_pk + "/handshake/0"
 
-        val_net_addr = f"/{host_proto}/{host}/tcp/{validator_port}/noise-ik/{network_pk}/handshake/0"
+        val_net_addr = host_prefix + str(validator_port) + noise_suffix
 
         # Optional shadow redirect: on-chain fullnode_address points at a
         # shadow VFN instead of the validator's own vfn server. See
@@ -355,19 +456,14 @@ def main():
                       f"but no matching [[shadow_nodes]] entry found")
                 sys.exit(1)
             shadow = shadow_lookup[shadow_id]
-            shadow_public_path = os.path.join(output_dir, shadow_id, 'config', 'identity.public.yaml')
-            shadow_full_path = os.path.join(output_dir, shadow_id, 'config', 'identity.yaml')
-            if os.path.exists(shadow_public_path):
-                shadow_identity_path = shadow_public_path
-            elif os.path.exists(shadow_full_path):
-                shadow_identity_path = shadow_full_path
-            else:
+            shadow_candidates = identity_candidates(os.path.join(output_dir, shadow_id))
+            shadow_identity_path, shadow_identity = load_identity(shadow_candidates)
+            if shadow_identity_path is None:
                 print(f"Error: shadow node '{shadow_id}' identity not found. "
-                      f"Tried {shadow_public_path} and {shadow_full_path}. Run 'make init' first.")
+                      f"Tried {' and '.join(shadow_candidates)}. Run 'make init' first.")
                 sys.exit(1)
-            shadow_identity = parse_simple_yaml(shadow_identity_path)
             shadow_network_pk = shadow_identity['network_public_key']
-            if shadow_network_pk.startswith('0x'):
+            if shadow_network_pk[:2] == '0x':
                 shadow_network_pk = shadow_network_pk[2:]
             shadow_host = shadow['host']
             shadow_vfn_port = shadow['vfn_port']
@@ -383,13 +479,11 @@ def main():
             print(f"[Aggregator] Validator {node_id}: fullnode_address redirected to "
                   f"shadow '{shadow_id}' ({shadow_host}:{shadow_vfn_port})")
         else:
-            vfn_net_addr = f"/{host_proto}/{host}/tcp/{vfn_port}/noise-ik/{network_pk}/handshake/0"
+            vfn_net_addr = host_prefix + str(vfn_port) + noise_suffix
         
-        # Consensus PoP: use node config value, identity file, or 96-byte dummy
-        # ValidatorManagement.sol requires non-empty consensusPop
-        DUMMY_POP = "0x" + "00" * 96
+        # Consensus PoP: use node config value, identity file, or DUMMY_POP
         consensus_pop = node.get('consensus_pop') or identity.get('consensus_pop') or DUMMY_POP
-        if not consensus_pop.startswith('0x'):
+        if consensus_pop[:2] != '0x':
             consensus_pop = f"0x{consensus_pop}"
 
         # Create validator entry
@@ -398,14 +492,14 @@ def main():
             "owner": owner_address,
             "staker": staker_address,
             "stakeAmount": stake_amount,
-            "moniker": f"validator-{len(validators) + 1}",
+            "moniker": f"validator-{i + 1}",
             "consensusPubkey": consensus_pk,
             "consensusPop": consensus_pop,
             "networkAddresses": val_net_addr,
             "fullnodeAddresses": vfn_net_addr,
             "votingPower": voting_power
         }
-        validators.append(validator)
+        validators[i] = validator
 
     # Build complete genesis config (matching GenesisConfig struct in genesis.rs)
     output = build_genesis_config(config, genesis_cfg)
@@ -413,9 +507,8 @@ def main():
     
     # Write to validator_genesis.json in output_dir
     output_path = os.path.join(output_dir, "validator_genesis.json")
-    with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
-        
+    write_json(output_path, output)
+
     print(f"[Aggregator] Successfully wrote {output_path}")
     print(f"[Aggregator] Configured {len(validators)} validators")
 
@@ -424,31 +517,21 @@ def main():
     faucet_alloc = {}
     
     if faucet_cfg:
-        private_key = faucet_cfg.get("private_key")
+        address = faucet_cfg.get("address")
         balance = faucet_cfg.get("balance")
-        
-        if private_key and balance:
-            # Derive address from private key (simple approach: use last 40 chars of keccak hash)
-            # For proper derivation, would need eth_account library
-            # Here we use a placeholder - in production use: Account.from_key(private_key).address
-            # For now, we'll include the private_key in the output for manual handling
-            address = faucet_cfg.get("address")
-            if not address:
-                # If no address provided, we can't auto-derive without eth_account
-                # Output the private_key for downstream tools to derive
-                print(f"[Aggregator] Faucet private_key provided, balance: {balance}")
-                print(f"[Aggregator] Note: Derive address externally or add 'address' field to genesis.toml")
-            else:
-                faucet_alloc[address] = {"balance": balance}
-        
-        # Also support explicit address/balance format
-        if "address" in faucet_cfg and "balance" in faucet_cfg:
-            faucet_alloc[faucet_cfg["address"]] = {"balance": faucet_cfg["balance"]}
-                
+
+        if address and "balance" in faucet_cfg:
+            faucet_alloc[address] = {"balance": balance}
+        elif faucet_cfg.get("private_key") and balance:
+            # No address given and we can't derive one from the private key
+            # without eth_account (Account.from_key(private_key).address), so
+            # leave the derivation to downstream tools.
+            print(f"[Aggregator] Faucet private_key provided, balance: {balance}")
+            print(f"[Aggregator] Note: Derive address externally or add 'address' field to genesis.toml")
+
     if faucet_alloc:
         faucet_alloc_path = os.path.join(output_dir, "faucet_alloc.json")
-        with open(faucet_alloc_path, 'w') as f:
-            json.dump(faucet_alloc, f, indent=2)
+        write_json(faucet_alloc_path, faucet_alloc)
         print(f"[Aggregator] Exported faucet allocation ({len(faucet_alloc)} accounts) to {faucet_alloc_path}")
 
 if __name__ == "__main__":
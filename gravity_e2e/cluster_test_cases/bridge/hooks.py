@@ -6,14 +6,21 @@ pre_start:  Start MockAnvil on port 8546 AND preload bridge events
 post_stop:  Shut down MockAnvil.
 """
 
+import argparse
 import json
 import logging
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOG = logging.getLogger(__name__)
 
 _mock = None
+_E2E_ROOT = str(Path(__file__).resolve().parents[2])
 _METADATA_FILE = "mock_anvil_metadata.json"
 
 # Defaults
@@ -23,12 +30,20 @@ _DEFAULT_RECIPIENT = "0x6954476eAe13Bd072D9f19406A6B9543514f765C"
 _DEFAULT_SENDER = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
 
 
+class _HookArgParser(argparse.ArgumentParser):
+    def error(self, message):
+        # argparse would print usage and exit(2); report the bad value instead
+        raise ValueError(f"[hook] {message}")
+
+
+# Picks our options out of the full pytest argv; accepts both "--opt N" and "--opt=N".
+_HOOK_PARSER = _HookArgParser(add_help=False, allow_abbrev=False)
+_HOOK_PARSER.add_argument("--bridge-count", type=int, default=_DEFAULT_BRIDGE_COUNT)
+
+
 def _parse_bridge_count(pytest_args: list) -> int:
     """Parse --bridge-count from pytest args."""
-    for i, arg in enumerate(pytest_args):
-        if arg == "--bridge-count" and i + 1 < len(pytest_args):
-            return int(pytest_args[i + 1])
-    return _DEFAULT_BRIDGE_COUNT
+    return _HOOK_PARSER.parse_known_args(pytest_args)[0].bridge_count
 
 
 def pre_start(test_dir: Path, env: dict, pytest_args: list = None):
@@ -36,9 +51,8 @@ def pre_start(test_dir: Path, env: dict, pytest_args: list = None):
     global _mock
 
     # Ensure gravity_e2e is importable
-    e2e_root = str(Path(__file__).resolve().parent.parent.parent)
-    if e2e_root not in sys.path:
-        sys.path.insert(0, e2e_root)
+    if _E2E_ROOT not in sys.path:
+        sys.path.insert(0, _E2E_ROOT)
 
     from gravity_e2e.utils.mock_anvil import MockAnvil, DEFAULT_PORTAL_ADDRESS
 
@@ -74,7 +88,10 @@ def pre_start(test_dir: Path, env: dict, pytest_args: list = None):
         "finalized_block": _mock.current_block,
     }
     metadata_path = test_dir / _METADATA_FILE
-    metadata_path.write_text(json.dumps(metadata, indent=2))
+    if orjson is not None:
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        metadata_path.write_text(json.dumps(metadata, indent=2))
     LOG.info(f"[hook] Wrote metadata to {metadata_path}")
 
 
@@ -11,6 +11,7 @@ than Anvil can produce new bridge events.
 """
 
 import asyncio
+import heapq
 import logging
 import time
 
@@ -24,6 +25,10 @@ from gravity_e2e.utils.bridge_utils import (
     GBRIDGE_RECEIVER_ADDRESS,
 )
 
+# pytest imports this directory's conftest.py as top-level `conftest` (no
+# package here), so that is the name to import the shared helper from.
+from conftest import _dump_node_logs
+
 LOG = logging.getLogger(__name__)
 
 
@@ -40,9 +45,9 @@ async def test_bridge_preloaded(
 
     Steps:
     1. Ensure gravity_node is live and producing blocks
-    2. Record balance before
-    3. Poll for all NativeMinted events (nonces 1..N)
-    4. Verify: balance delta == N × amount
+    2. Poll for all NativeMinted events (nonces 1..N)
+    3. Verify: all events carry the expected recipient and amount
+    4. Verify: final balance >= N × amount
     5. Verify: all nonces continuous, no missing
     6. Compute per-event latency and report stats
     """
@@ -65,9 +70,6 @@ async def test_bridge_preloaded(
     assert node is not None, "node1 not found in cluster"
     gravity_w3 = node.w3
 
-    # Record balance before processing
-    balance_before = gravity_w3.eth.get_balance(recipient)
-    LOG.info(f"Balance before: {balance_before} wei")
     LOG.info(
         f"Waiting for {bridge_count} NativeMinted events "
         f"(timeout={bridge_verify_timeout}s)..."
@@ -106,24 +108,27 @@ async def test_bridge_preloaded(
         # Get source-chain (Anvil) timestamps for each nonce
         anvil_timestamps = helper.query_message_sent_timestamps(from_block=0)
 
+        # Both maps are keyed by the int nonce from the decoded events.
+        paired = [
+            (evt["nonce"], float(evt["block_timestamp"] - anvil_timestamps[evt["nonce"]]))
+            for evt in events
+            if evt.get("block_timestamp") is not None and evt["nonce"] in anvil_timestamps
+        ]
         stats = BridgeStats()
-        skipped = 0
-        for evt in events:
-            nonce_val = evt["nonce"]
-            gravity_ts = evt.get("block_timestamp")
-            anvil_ts = anvil_timestamps.get(nonce_val)
-
-            if gravity_ts is not None and anvil_ts is not None:
-                latency = gravity_ts - anvil_ts
-                stats.record(nonce=nonce_val, latency=float(latency), amount=amount)
-            else:
-                skipped += 1
-                LOG.debug(
-                    f"  Nonce {nonce_val}: missing timestamp "
-                    f"(gravity_ts={gravity_ts}, anvil_ts={anvil_ts})"
-                )
+        if paired:
+            nonce_vals, latencies = map(list, zip(*paired))
+            stats.record_bulk(nonces=nonce_vals, latencies=latencies, amount=amount)
 
+        skipped = len(events) - len(paired)
         if skipped > 0:
+            if LOG.isEnabledFor(logging.DEBUG):
+                for evt in events:
+                    if evt.get("block_timestamp") is None or evt["nonce"] not in anvil_timestamps:
+                        LOG.debug(
+                            f"  Nonce {evt['nonce']}: missing timestamp "
+                            f"(gravity_ts={evt.get('block_timestamp')}, "
+                            f"anvil_ts={anvil_timestamps.get(evt['nonce'])})"
+                        )
             LOG.warning(f"  Skipped {skipped} events due to missing timestamps")
 
         stats.report()
@@ -134,49 +139,53 @@ async def test_bridge_preloaded(
     if len(missing) > 0:
         # Dump node logs for CI diagnosis before assertion fails
         LOG.warning(f"  {len(missing)} missing nonces — dumping node logs for diagnosis:")
-        for node_id, node_obj in cluster.nodes.items():
-            from gravity_e2e.cluster_test_cases.bridge.conftest import (
-                _dump_node_logs,
-            )
-            _dump_node_logs(node_id, node_obj._infra_path, tail_lines=50, label="on-failure")
+
+        def dump_all():
+            # One worker, nodes in turn: each node's tail stays contiguous in
+            # the log instead of interleaving line by line.
+            for node_id, node_obj in cluster.nodes.items():
+                _dump_node_logs(node_id, node_obj._infra_path, tail_lines=50, label="on-failure")
+
+        await asyncio.to_thread(dump_all)
 
     assert len(missing) == 0, (
         f"{len(missing)} nonces not found (out of {bridge_count}): "
-        f"{sorted(missing)[:20]}{'...' if len(missing) > 20 else ''}"
+        f"{heapq.nsmallest(20, missing)}{'...' if len(missing) > 20 else ''}"
     )
 
-    # Verify all events have correct recipient and amount
-    for evt in events:
-        assert evt["recipient"] == recipient, (
-            f"Nonce {evt['nonce']}: recipient mismatch: "
-            f"expected {recipient}, got {evt['recipient']}"
+    # Verify all events have correct recipient and amount (one pass; the
+    # per-field messages are only built for the first offending event)
+    bad = next(
+        (evt for evt in events if evt["recipient"] != recipient or evt["amount"] != amount),
+        None,
+    )
+    if bad is not None:
+        assert bad["recipient"] == recipient, (
+            f"Nonce {bad['nonce']}: recipient mismatch: "
+            f"expected {recipient}, got {bad['recipient']}"
         )
-        assert evt["amount"] == amount, (
-            f"Nonce {evt['nonce']}: amount mismatch: "
-            f"expected {amount}, got {evt['amount']}"
+        assert bad["amount"] == amount, (
+            f"Nonce {bad['nonce']}: amount mismatch: "
+            f"expected {amount}, got {bad['amount']}"
         )
 
-    # Verify nonce continuity
-    nonces_found = sorted(found)
-    expected_nonces = list(range(1, bridge_count + 1))
-    assert nonces_found == expected_nonces, (
+    # Verify nonce continuity: `found` is a set of distinct nonces, so N of
+    # them spanning exactly 1..N leaves no gaps.
+    lo, hi = min(found), max(found)
+    assert len(found) == bridge_count and lo == 1 and hi == bridge_count, (
         f"Nonces not continuous: "
-        f"expected 1→{bridge_count}, got {nonces_found[0]}→{nonces_found[-1]}"
+        f"expected 1→{bridge_count}, got {lo}→{hi}"
     )
 
-    # Verify cumulative balance (use absolute check since in MockAnvil mode
-    # events may already be partially minted before balance_before was recorded)
+    # Verify cumulative balance. This is an absolute check: in MockAnvil mode
+    # events may be minted before the test body runs, so a pre-poll balance
+    # read is not a reliable baseline and is skipped. Every event was checked
+    # above for recipient and amount; the balance just has to hold them all.
     balance_after = gravity_w3.eth.get_balance(recipient)
     expected_total = bridge_count * amount
     LOG.info(
-        f"Balance check: before={balance_before}, after={balance_after}, "
-        f"delta={balance_after - balance_before}, expected_total={expected_total}"
+        f"Balance check: after={balance_after}, expected_total={expected_total}"
     )
-    # The final balance should be at least balance_before + expected, but since
-    # balance_before may already include some minted amounts, just verify
-    # that the expected total minted amount is in the final balance.
-    # If recipient started with 0, balance_after == expected_total.
-    # If balance_before already included some, delta < expected_total.
     assert balance_after >= expected_total, (
         f"Balance too low: expected at least {expected_total}, got {balance_after}"
     )
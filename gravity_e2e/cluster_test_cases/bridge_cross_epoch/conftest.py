@@ -9,29 +9,35 @@ Pre-Load & Verify pattern:
   5. Test verifies all N NativeMinted events on gravity chain
 """
 
+import functools
 import glob
 import json
 import logging
+import re
+import signal
 import subprocess
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 
 _current_dir = Path(__file__).resolve().parent
-# Add gravity_e2e parent to path
-_gravity_e2e_parent = _current_dir
-while _gravity_e2e_parent.name != "gravity_e2e" or not (_gravity_e2e_parent / "gravity_e2e").is_dir():
-    _gravity_e2e_parent = _gravity_e2e_parent.parent
-    if _gravity_e2e_parent == _gravity_e2e_parent.parent:
-        break
+# Add gravity_e2e parent to path (<gravity_e2e>/cluster_test_cases/<suite>/)
+_gravity_e2e_parent = _current_dir.parents[1]
+assert _gravity_e2e_parent.name == "gravity_e2e", _gravity_e2e_parent
 if str(_gravity_e2e_parent) not in sys.path:
     sys.path.insert(0, str(_gravity_e2e_parent))
 
 import pytest
 from web3 import Web3
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from gravity_e2e.utils.anvil_manager import AnvilManager, BridgeContracts
 from gravity_e2e.utils.bridge_utils import BridgeHelper
 from gravity_e2e.utils.mock_anvil import MockAnvil
@@ -51,10 +57,26 @@ ANVIL_RELAYER_CONFIG = {
         "gravity://0/31337/events?contract=0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512&eventSignature=0x5646e682c7d994bf11f5a2c8addb60d03c83cda3b65025a826346589df43406e&fromBlock=0": "http://localhost:8546"
     }
 }
+# Serialized once; written verbatim into every node's config dir.
+_ANVIL_RELAYER_CONFIG_BYTES = json.dumps(ANVIL_RELAYER_CONFIG, indent=2).encode()
 
 # Bridge amount per transaction: 1000 G tokens (in wei)
 BRIDGE_AMOUNT = 1000 * 10**18
 
+# Logged by the node's RelayerWrapper::add_uri once the relayer has picked up
+# a URI from relayer_config.json — our signal that the relayer is live.
+RELAYER_READY_MARKER = b"Adding URI:"
+RELAYER_READY_TIMEOUT = 30
+# Same graceful window stop.sh gives gravity_node before escalating to SIGKILL.
+NODE_STOP_TIMEOUT = 30
+
+# reth.log lines worth surfacing when diagnosing relayer / data-source issues.
+# Matched against the lower-cased line: re.IGNORECASE makes this alternation
+# several times slower than lowering the line first.
+_RELAYER_LOG_LINE_RE = re.compile(
+    r"relayer|data source|blockchain_source|event|oracle|8546|connection|error|warn"
+)
+
 
 def pytest_addoption(parser):
     """Add bridge-specific command line options."""
@@ -82,6 +104,12 @@ def pytest_addoption(parser):
         default=True,
         help="Use MockAnvil instead of real Anvil (default: True for stress tests)",
     )
+    parser.addoption(
+        "--relayer-ready-timeout",
+        action="store",
+        default=str(RELAYER_READY_TIMEOUT),
+        help=f"Max seconds to wait for relayers to come up after restart (default: {RELAYER_READY_TIMEOUT})",
+    )
     parser.addoption(
         "--first-batch-fraction",
         action="store",
@@ -99,16 +127,25 @@ def pytest_addoption(parser):
 @pytest.fixture(scope="session")
 def contracts_dir(request) -> Path:
     """Get gravity_chain_core_contracts directory."""
-    val = request.config.getoption("--contracts-dir")
-    if val:
-        return Path(val).resolve()
-    env_val = os.environ.get(CONTRACTS_DIR_ENV)
+    return _discover_contracts_dir(
+        request.config.getoption("--contracts-dir"),
+        os.environ.get(CONTRACTS_DIR_ENV),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _discover_contracts_dir(cli_val, env_val) -> Path:
+    """Resolve the contracts checkout: CLI option, env var, then known locations."""
+    if cli_val:
+        return Path(cli_val).resolve()
     if env_val:
         return Path(env_val).resolve()
-    if DEFAULT_CONTRACTS_DIR.exists():
-        return DEFAULT_CONTRACTS_DIR
-    if EXTERNAL_CONTRACTS_DIR.exists():
-        return EXTERNAL_CONTRACTS_DIR
+    for candidate in (DEFAULT_CONTRACTS_DIR, EXTERNAL_CONTRACTS_DIR):
+        try:
+            os.stat(candidate)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        return candidate
     raise RuntimeError(
         f"gravity_chain_core_contracts not found. "
         f"Set --contracts-dir or {CONTRACTS_DIR_ENV} env var."
@@ -127,6 +164,12 @@ def bridge_verify_timeout(request) -> int:
     return int(request.config.getoption("--bridge-verify-timeout"))
 
 
+@pytest.fixture(scope="session")
+def relayer_ready_timeout(request) -> float:
+    """Upper bound on the post-restart relayer readiness wait."""
+    return float(request.config.getoption("--relayer-ready-timeout"))
+
+
 @pytest.fixture(scope="session")
 def use_mock_anvil(request) -> bool:
     """Whether to use MockAnvil instead of real Anvil."""
@@ -134,7 +177,10 @@ def use_mock_anvil(request) -> bool:
 
 
 @pytest.fixture(scope="module")
-def preloaded_bridge(cluster, contracts_dir: Path, bridge_count: int, use_mock_anvil: bool):
+def preloaded_bridge(
+    cluster, contracts_dir: Path, bridge_count: int, use_mock_anvil: bool,
+    relayer_ready_timeout: float,
+):
     """
     Full bridge lifecycle fixture with pre-loading.
 
@@ -168,6 +214,7 @@ def preloaded_bridge(cluster, contracts_dir: Path, bridge_count: int, use_mock_a
         yield from _preloaded_bridge_real_anvil(
             cluster, contracts_dir, bridge_count, cluster_scripts_dir,
             stop_script, start_script, config_path_str, env,
+            relayer_ready_timeout,
         )
 
 
@@ -179,17 +226,18 @@ def _preloaded_bridge_mock_anvil(
     MockAnvil path — hooks.py already started MockAnvil and preloaded events
     before the node started. This fixture just reads the metadata and yields.
     """
-    import json as _json
     from gravity_e2e.utils.mock_anvil import DEFAULT_PORTAL_ADDRESS
 
     metadata_file = Path(__file__).parent / "mock_anvil_metadata.json"
-    if not metadata_file.exists():
+    try:
+        raw = metadata_file.read_bytes()
+    except FileNotFoundError:
         raise RuntimeError(
             "mock_anvil_metadata.json not found! "
             "Ensure hooks.py pre_start was called by the runner."
-        )
+        ) from None
 
-    metadata = _json.loads(metadata_file.read_text())
+    metadata = _json_loads(raw)
     LOG.info(
         f"[MockAnvil] Read metadata: {metadata['bridge_count']} events, "
         f"finalized_block={metadata['finalized_block']}"
@@ -219,27 +267,36 @@ def _preloaded_bridge_mock_anvil(
 def _preloaded_bridge_real_anvil(
     cluster, contracts_dir, bridge_count, cluster_scripts_dir,
     stop_script, start_script, config_path_str, env,
+    relayer_ready_timeout=RELAYER_READY_TIMEOUT,
 ):
     """Original Anvil path: deploy contracts via forge, batch-bridge."""
     mgr = AnvilManager()
+    anvil_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="anvil_start_")
 
     try:
-        # Phase 1: Stop nodes
-        LOG.info("Phase 1: Stopping gravity nodes...")
-        subprocess.run(
-            ["bash", str(stop_script), "--config", config_path_str],
-            cwd=str(cluster_scripts_dir),
-            env=env,
-            check=True,
+        # Phase 1: Stop nodes. Anvil on 8546 does not depend on the gravity
+        #          nodes, so boot it in the background while they shut down.
+        LOG.info("Phase 1: Stopping gravity nodes (starting Anvil in background)...")
+        anvil_started = anvil_pool.submit(
+            mgr.start, port=8546, block_time=None, gas_limit=100_000_000  # 100M gas/block
         )
+        if not _stop_nodes(cluster):
+            LOG.warning("  In-process stop incomplete, falling back to stop.sh")
+            subprocess.run(
+                ["bash", str(stop_script), "--config", config_path_str],
+                cwd=str(cluster_scripts_dir),
+                env=env,
+                check=True,
+            )
+        _mark_lifecycle_changed(cluster)
         time.sleep(2)
 
         # Phase 2: Start Anvil in AUTO-MINE mode and deploy contracts.
         #          Auto-mine is fast because batch_mint_and_bridge uses
         #          BatchBridgeCaller contract (~200 txns for 20K bridges).
         #          After pre-loading, switch to interval mining for the test.
-        LOG.info("Phase 2: Starting Anvil (auto-mine) and deploying contracts...")
-        mgr.start(port=8546, block_time=None, gas_limit=100_000_000)  # 100M gas/block
+        LOG.info("Phase 2: Waiting for Anvil (auto-mine) and deploying contracts...")
+        anvil_started.result()
         contracts = mgr.deploy_bridge_contracts(contracts_dir)
 
         # Create bridge helper
@@ -275,7 +332,9 @@ def _preloaded_bridge_real_anvil(
         # Switch Anvil to interval mining (1s blocks) for realistic test
         LOG.info("  Switching Anvil to interval mining (1s blocks)...")
         import requests as req
-        req.post(contracts.rpc_url, json={
+        # One keep-alive session for every Anvil JSON-RPC call below.
+        session = req.Session()
+        session.post(contracts.rpc_url, json={
             "jsonrpc": "2.0",
             "method": "evm_setIntervalMining",
             "params": [1],
@@ -287,7 +346,7 @@ def _preloaded_bridge_real_anvil(
         # Anvil has a ~64-block finalization lag. The relayer only scans
         # finalized blocks (eth_getBlockByNumber("finalized")), so we must
         # wait until the finalized block covers all pre-loaded events.
-        latest_resp = req.post(contracts.rpc_url, json={
+        latest_resp = session.post(contracts.rpc_url, json={
             "jsonrpc": "2.0",
             "method": "eth_getBlockByNumber",
             "params": ["latest", False],
@@ -299,67 +358,47 @@ def _preloaded_bridge_real_anvil(
             f"Waiting for finalization (Anvil lag ~64 blocks)..."
         )
 
-        deadline = time.time() + 180  # 3 min max wait
-        while time.time() < deadline:
-            fin_resp = req.post(contracts.rpc_url, json={
-                "jsonrpc": "2.0",
-                "method": "eth_getBlockByNumber",
-                "params": ["finalized", False],
-                "id": 11,
-            }).json()
-            fin_result = fin_resp.get("result")
-            if fin_result:
-                fin_block = int(fin_result["number"], 16)
-                if fin_block >= preload_block:
-                    LOG.info(
-                        f"  Finalized block {fin_block} >= preload block "
-                        f"{preload_block} — ready!"
-                    )
-                    break
-                LOG.info(
-                    f"  Finalization: {fin_block}/{preload_block} "
-                    f"(waiting...)"
-                )
-            else:
-                LOG.info("  Finalized block not yet available, waiting...")
-            time.sleep(5)
+        fin_block = _wait_anvil_finalized(session, contracts.rpc_url, preload_block, timeout=180)
+        if fin_block is not None and fin_block >= preload_block:
+            LOG.info(
+                f"  Finalized block {fin_block} >= preload block "
+                f"{preload_block} — ready!"
+            )
         else:
             LOG.warning(
                 f"  Timed out waiting for finalization "
                 f"(finalized={fin_block}, needed={preload_block}). "
                 f"Continuing anyway..."
             )
+        session.close()
 
         # Phase 4: Clean stale relayer state + write config + restart gravity_node
         LOG.info("Phase 4: Cleaning relayer state, writing config, restarting nodes...")
-        for node_id, node in cluster.nodes.items():
-            # Delete stale relayer_state.json so the relayer does a cold start
-            # against the fresh Anvil instance
-            relayer_state = node._infra_path / "data" / "reth" / "relayer_state.json"
-            if relayer_state.exists():
-                LOG.info(f"  Removing stale relayer_state.json for {node_id}")
-                relayer_state.unlink()
-
-            relayer_path = node._infra_path / "config" / "relayer_config.json"
-            if relayer_path.parent.exists():
-                LOG.info(f"  Writing relayer_config.json for {node_id}")
-                with open(relayer_path, "w") as f:
-                    json.dump(ANVIL_RELAYER_CONFIG, f, indent=2)
+        nodes = list(cluster.nodes.items())
+        with ThreadPoolExecutor(max_workers=min(len(nodes), 16) or 1) as pool:
+            resets = list(pool.map(lambda item: _reset_relayer_files(item[1]._infra_path), nodes))
+        for (node_id, node), (removed_state, wrote_config) in zip(nodes, resets):
+            if removed_state:
+                LOG.info(f"  Removed stale relayer_state.json for {node_id}")
+            if wrote_config:
+                LOG.info(f"  Wrote relayer_config.json for {node_id}")
 
             # --- Diagnostic: verify config was written correctly ---
             _dump_relayer_diagnostics(node_id, node._infra_path)
 
+        log_offsets = _snapshot_log_offsets(cluster)
         subprocess.run(
             ["bash", str(start_script), "--config", config_path_str],
             cwd=str(cluster_scripts_dir),
             env=env,
             check=True,
         )
-        time.sleep(15)  # warmup — node needs time to init relayer
+        _mark_lifecycle_changed(cluster)
+        _wait_relayer_ready(cluster, log_offsets, relayer_ready_timeout)
 
         # --- Diagnostic: dump early node logs for relayer init ---
         for node_id, node in cluster.nodes.items():
-            _dump_node_logs(node_id, node._infra_path, tail_lines=30, label="post-warmup")
+            _dump_node_logs(node_id, node._infra_path, tail_lines=30, label="post-start")
 
         yield {
             "contracts": contracts,
@@ -371,104 +410,432 @@ def _preloaded_bridge_real_anvil(
         }
 
     finally:
+        anvil_pool.shutdown(wait=True)  # never race mgr.stop() against a start in flight
         mgr.stop()
 
 
 
+def _anvil_finalized_block(session, rpc_url: str) -> Optional[int]:
+    """Anvil's current finalized block number, or None if it has none yet."""
+    fin_result = session.post(rpc_url, json={
+        "jsonrpc": "2.0",
+        "method": "eth_getBlockByNumber",
+        "params": ["finalized", False],
+        "id": 11,
+    }).json().get("result")
+    return int(fin_result["number"], 16) if fin_result else None
+
+
+def _wait_anvil_finalized(session, rpc_url: str, target_block: int, timeout: float) -> Optional[int]:
+    """
+    Wait until Anvil's finalized block reaches `target_block`.
+
+    Re-checks on every newHeads notification from Anvil's WebSocket endpoint,
+    so finalization is seen within one block. Falls back to HTTP polling with
+    backoff if the subscription can't be set up. Returns the last finalized
+    block seen (None if Anvil never reported one).
+    """
+    deadline = time.monotonic() + timeout
+    fin_block = _anvil_finalized_block(session, rpc_url)
+    if fin_block is not None and fin_block >= target_block:
+        return fin_block
+
+    try:
+        from websockets.sync.client import connect
+
+        with connect("ws" + rpc_url[len("http"):], open_timeout=5) as ws:
+            ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "method": "eth_subscribe",
+                "params": ["newHeads"],
+                "id": 12,
+            }))
+            reply = json.loads(ws.recv(timeout=5))
+            if "error" in reply:
+                raise RuntimeError(reply["error"])
+            LOG.info("  Watching Anvil newHeads for finalization...")
+            heads = 0
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    ws.recv(timeout=remaining)
+                except TimeoutError:
+                    break  # deadline reached with no new head
+                fin_block = _anvil_finalized_block(session, rpc_url)
+                if fin_block is not None and fin_block >= target_block:
+                    return fin_block
+                heads += 1
+                if heads % 10 == 0:
+                    LOG.info(f"  Finalization: {fin_block}/{target_block} (waiting...)")
+            return fin_block
+    except Exception as e:
+        LOG.info(f"  newHeads subscription unavailable ({e}); polling over HTTP")
+
+    poll_interval = 0.5  # backs off to 5s
+    while time.monotonic() < deadline:
+        fin_block = _anvil_finalized_block(session, rpc_url)
+        if fin_block is not None:
+            if fin_block >= target_block:
+                break
+            LOG.info(f"  Finalization: {fin_block}/{target_block} (waiting...)")
+        else:
+            LOG.info("  Finalized block not yet available, waiting...")
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, 5)
+    return fin_block
+
+
 # ============================================================================
 # Diagnostic helpers
 # ============================================================================
 
+ANVIL_PROBE_URL = "http://localhost:8546"
+
+# One probe client per URL, shared by every node's diagnostics so the
+# provider's HTTP session (and its keep-alive connection) is reused.
+_ANVIL_PROBES: Dict[str, Web3] = {}
+
+
+def _anvil_probe(url: str) -> Web3:
+    w3 = _ANVIL_PROBES.get(url)
+    if w3 is None:
+        w3 = _ANVIL_PROBES[url] = Web3(Web3.HTTPProvider(url, request_kwargs={"timeout": 5}))
+    return w3
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON bytes, with orjson when it is installed."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+class _LazyJson:
+    """Defers json.dumps until a log record is actually formatted."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        if orjson is not None:
+            return orjson.dumps(self.obj).decode()
+        return json.dumps(self.obj)
+
+
 def _dump_relayer_diagnostics(node_id: str, infra_path: Path) -> None:
     """Verify relayer and reth config are correct after writing."""
-    # 1. Read back relayer_config.json
+    if not LOG.isEnabledFor(logging.WARNING):
+        return  # every check below only exists to be logged
+    # 1. Read back relayer_config.json. We know the exact bytes we wrote, so
+    #    compare those instead of re-parsing the JSON.
     relayer_path = infra_path / "config" / "relayer_config.json"
-    if relayer_path.exists():
-        with open(relayer_path) as f:
-            content = json.load(f)
-        LOG.info(f"  [{node_id}] relayer_config.json verified: {json.dumps(content)}")
+    try:
+        written = relayer_path.read_bytes()
+    except FileNotFoundError:
+        LOG.warning("  [%s] relayer_config.json NOT FOUND at %s", node_id, relayer_path)
     else:
-        LOG.warning(f"  [{node_id}] relayer_config.json NOT FOUND at {relayer_path}")
+        if written == _ANVIL_RELAYER_CONFIG_BYTES:
+            LOG.info("  [%s] relayer_config.json verified: %s", node_id, _LazyJson(ANVIL_RELAYER_CONFIG))
+        else:
+            LOG.warning(
+                "  [%s] relayer_config.json differs from what was written: %s",
+                node_id, written.decode(errors="replace"),
+            )
 
     # 2. Read reth_config.json to verify relayer_config path reference
     reth_config_path = infra_path / "config" / "reth_config.json"
-    if reth_config_path.exists():
-        with open(reth_config_path) as f:
-            reth_cfg = json.load(f)
+    try:
+        raw = reth_config_path.read_bytes()
+    except FileNotFoundError:
+        LOG.warning("  [%s] reth_config.json NOT FOUND at %s", node_id, reth_config_path)
+    else:
+        reth_cfg = _json_loads(raw)
         rc_ref = reth_cfg.get("reth_args", {}).get("relayer_config", "NOT SET")
-        LOG.info(f"  [{node_id}] reth_config.json gravity.relayer-config = {rc_ref}")
+        LOG.info("  [%s] reth_config.json gravity.relayer-config = %s", node_id, rc_ref)
         # Check that the referenced path matches our written file
         if rc_ref != str(relayer_path):
             LOG.warning(
-                f"  [{node_id}] MISMATCH: reth_config points to {rc_ref} "
-                f"but we wrote to {relayer_path}"
+                "  [%s] MISMATCH: reth_config points to %s but we wrote to %s",
+                node_id, rc_ref, relayer_path,
             )
-    else:
-        LOG.warning(f"  [{node_id}] reth_config.json NOT FOUND at {reth_config_path}")
 
     # 3. Check that relayer_state.json does NOT exist (clean slate)
     state_path = infra_path / "data" / "reth" / "relayer_state.json"
-    if state_path.exists():
-        with open(state_path) as f:
-            state = json.load(f)
+    try:
+        raw = state_path.read_bytes()
+    except FileNotFoundError:
+        LOG.info("  [%s] relayer_state.json absent (clean slate) ✓", node_id)
+    else:
         LOG.warning(
-            f"  [{node_id}] relayer_state.json STILL EXISTS after cleanup: "
-            f"{json.dumps(state)}"
+            "  [%s] relayer_state.json STILL EXISTS after cleanup: %s", node_id, _LazyJson(_json_loads(raw))
         )
-    else:
-        LOG.info(f"  [{node_id}] relayer_state.json absent (clean slate) ✓")
 
     # 4. Verify Anvil is reachable
     try:
-        from web3 import Web3
-        w3_check = Web3(Web3.HTTPProvider("http://localhost:8546", request_kwargs={"timeout": 5}))
+        w3_check = _anvil_probe(ANVIL_PROBE_URL)
         if w3_check.is_connected():
             bn = w3_check.eth.block_number
-            LOG.info(f"  [{node_id}] Anvil connectivity check OK (block={bn})")
+            LOG.info("  [%s] Anvil connectivity check OK (block=%s)", node_id, bn)
         else:
-            LOG.warning(f"  [{node_id}] Anvil connectivity FAILED (not connected)")
+            LOG.warning("  [%s] Anvil connectivity FAILED (not connected)", node_id)
     except Exception as e:
-        LOG.warning(f"  [{node_id}] Anvil connectivity FAILED: {e}")
+        LOG.warning("  [%s] Anvil connectivity FAILED: %s", node_id, e)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # exists but not ours
+    return True
+
+
+def _mark_lifecycle_changed(cluster) -> None:
+    """Nodes were stopped/started behind Node.stop()/start(); drop cached progress."""
+    now = time.monotonic()
+    for node in cluster.nodes.values():
+        node.lifecycle_changed_at = now
+
+
+def _stop_nodes(cluster, timeout: float = NODE_STOP_TIMEOUT) -> bool:
+    """In-process equivalent of stop.sh: SIGTERM every node, wait, then SIGKILL.
+
+    All nodes are signalled up front so their shutdowns (RocksDB flush) overlap
+    instead of running one after another. Pid files are removed only once the
+    process is gone, as stop.sh does. Returns False if a pid cannot be read or
+    signalled, or a process survives SIGKILL; the caller then runs stop.sh.
+    """
+    running = {}
+    for node_id, node in cluster.nodes.items():
+        try:
+            pid = int(node.pid_file.read_text().strip())
+        except FileNotFoundError:
+            continue  # not running
+        except ValueError:
+            return False
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            node.pid_file.unlink(missing_ok=True)  # stale pid file
+            continue
+        except PermissionError:
+            return False
+        LOG.info(f"  Stopping {node_id} (PID: {pid})...")
+        running[node_id] = (node, pid)
+
+    for escalate, grace in ((False, timeout), (True, 20.0)):
+        if escalate and running:
+            LOG.warning(f"  Force killing {sorted(running)}...")
+            for _, pid in running.values():
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+        deadline = time.monotonic() + grace
+        while running:
+            for node_id, (node, pid) in list(running.items()):
+                if not _pid_alive(pid):
+                    node.pid_file.unlink(missing_ok=True)
+                    LOG.info(f"  {node_id} stopped")
+                    del running[node_id]
+            if not running or time.monotonic() >= deadline:
+                break
+            time.sleep(0.25)
+    return not running
+
+
+def _node_log_paths(infra_path: Path) -> List[Path]:
+    """debug.log plus every execution-layer reth.log of a node."""
+    return [infra_path / "logs" / "debug.log", *(p for p, _ in _reth_logs(infra_path / "execution_logs"))]
+
+
+def _snapshot_log_offsets(cluster) -> dict:
+    """Record current log (inode, size) so readiness checks ignore output from earlier runs.
+
+    debug.log is left out: start.sh truncates it in place (same inode) and the
+    node can regrow it past the old size before the first poll, so it is
+    always scanned from the start. reth.logs are appended to across restarts.
+    """
+    offsets = {}
+    for node in cluster.nodes.values():
+        for path, _ in _reth_logs(node._infra_path / "execution_logs"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            offsets[path] = (st.st_ino, st.st_size)
+    return offsets
+
+
+def _log_has_new_marker(path: Path, marker: bytes, offsets: dict) -> bool:
+    """Scan only the bytes appended to `path` since the last call for `marker`.
+
+    `offsets` maps path -> (inode, offset). A log that was replaced (new inode)
+    or truncated (shorter than the offset) is scanned from the start, since
+    start.sh may recreate it and regrow it past the old size before the first poll.
+    """
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            ino, offset = offsets.get(path, (st.st_ino, 0))
+            if ino != st.st_ino or st.st_size < offset:
+                offset = 0
+            f.seek(offset)
+            chunk = f.read()
+    except FileNotFoundError:
+        return False
+    # Re-scan the tail next time in case the marker straddles two reads.
+    offsets[path] = (st.st_ino, max(offset, offset + len(chunk) - len(marker)))
+    return marker in chunk
+
+
+def _wait_relayer_ready(cluster, offsets: dict, timeout: float = RELAYER_READY_TIMEOUT) -> None:
+    """Poll node logs until every relayer has registered its URI, or time out."""
+    LOG.info("Waiting for relayers to come up...")
+    pending = dict(cluster.nodes)
+    deadline = time.monotonic() + timeout
+    delay = 0.25
+    while True:
+        for node_id, node in list(pending.items()):
+            if any(_log_has_new_marker(p, RELAYER_READY_MARKER, offsets)
+                   for p in _node_log_paths(node._infra_path)):
+                LOG.info(f"  [{node_id}] relayer ready")
+                del pending[node_id]
+        if not pending:
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            LOG.warning(
+                f"  Relayer not ready after {timeout}s on {sorted(pending)}. "
+                f"Continuing anyway..."
+            )
+            return
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 2.0)
+
+
+def _reth_logs(exec_log_dir: Path) -> List[Tuple[Path, float]]:
+    """(path, mtime) of every execution_logs/*/reth.log, via one scandir pass."""
+    found = []
+    try:
+        with os.scandir(exec_log_dir) as it:
+            for sub in it:
+                if not sub.is_dir(follow_symlinks=False):
+                    continue
+                candidate = os.path.join(sub.path, "reth.log")
+                try:
+                    found.append((Path(candidate), os.stat(candidate).st_mtime))
+                except FileNotFoundError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return found
+
+
+def _reset_relayer_files(infra_path: Path) -> Tuple[bool, bool]:
+    """Point one node's relayer at the fresh Anvil instance.
+
+    Deletes the stale relayer_state.json so the relayer does a cold start, and
+    writes the Anvil relayer_config.json if the node has a config dir.
+    Returns (removed_state, wrote_config). Only touches this node's files, so
+    Phase 4 runs it for all nodes concurrently.
+    """
+    try:
+        (infra_path / "data" / "reth" / "relayer_state.json").unlink()
+        removed_state = True
+    except FileNotFoundError:
+        removed_state = False
+    try:
+        (infra_path / "config" / "relayer_config.json").write_bytes(_ANVIL_RELAYER_CONFIG_BYTES)
+        wrote_config = True
+    except FileNotFoundError:
+        wrote_config = False  # node has no config dir
+    return removed_state, wrote_config
+
+
+def _latest_reth_log(exec_log_dir: Path) -> Optional[Path]:
+    """Most recently modified execution_logs/*/reth.log, or None.
+
+    Raises FileNotFoundError if execution_logs itself is missing.
+    """
+    exec_log_dir.stat()
+    newest = max(_reth_logs(exec_log_dir), key=lambda entry: entry[1], default=None)
+    return newest[0] if newest else None
+
+
+def _tail_lines(
+    path: Path, n: int, keep: Optional[Callable[[str], bool]] = None, block: int = 65536
+) -> Tuple[List[str], int]:
+    """Return the last `n` lines of `path` that pass `keep`, plus how many lines were scanned.
+
+    Reads backwards from the end of the file in doubling blocks, so only the
+    tail is decoded unless the matching lines are sparse.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        while True:
+            start = max(0, size - block)
+            f.seek(start)
+            lines = f.read(size - start).decode(errors="replace").splitlines()
+            if start > 0:
+                lines = lines[1:]  # first line is most likely cut off
+            scanned = len(lines)
+            if keep is not None:
+                lines = [l for l in lines if keep(l)]
+            if len(lines) >= n or start == 0:
+                return lines[-n:], scanned
+            block *= 2
 
 
 def _dump_node_logs(node_id: str, infra_path: Path, tail_lines: int = 30, label: str = "") -> None:
     """Dump tail of debug.log and reth.log for diagnostics."""
+    if not LOG.isEnabledFor(logging.WARNING):
+        return
+    # The tails are INFO output; below that only the missing-file warnings remain.
+    verbose = LOG.isEnabledFor(logging.INFO)
     prefix = f"  [{node_id}] [{label}]" if label else f"  [{node_id}]"
 
     # debug.log (stdout/stderr of gravity_node)
     debug_log = infra_path / "logs" / "debug.log"
-    if debug_log.exists():
-        lines = debug_log.read_text().splitlines()
-        tail = lines[-tail_lines:] if len(lines) > tail_lines else lines
-        LOG.info(f"{prefix} debug.log (last {len(tail)} lines):")
-        for line in tail:
-            LOG.info(f"    {line}")
-    else:
-        LOG.warning(f"{prefix} debug.log NOT FOUND at {debug_log}")
+    try:
+        if verbose:
+            tail, _ = _tail_lines(debug_log, tail_lines)
+            LOG.info("%s debug.log (last %d lines):", prefix, len(tail))
+            for line in tail:
+                LOG.info("    %s", line)
+        else:
+            debug_log.stat()
+    except FileNotFoundError:
+        LOG.warning("%s debug.log NOT FOUND at %s", prefix, debug_log)
 
     # reth.log (execution layer file logging)
     exec_log_dir = infra_path / "execution_logs"
-    if exec_log_dir.exists():
-        # Find all reth.log files in subdirectories
-        reth_logs = sorted(exec_log_dir.glob("*/reth.log"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if reth_logs:
-            reth_log = reth_logs[0]  # most recent
-            lines = reth_log.read_text().splitlines()
-            # Filter for relayer-related lines
-            relayer_lines = [l for l in lines if any(kw in l.lower() for kw in
-                            ["relayer", "data source", "blockchain_source", "event",
-                             "oracle", "8546", "connection", "error", "warn"])]
-            if relayer_lines:
-                tail = relayer_lines[-tail_lines:]
-                LOG.info(f"{prefix} reth.log relayer lines (last {len(tail)}):")
-                for line in tail:
-                    LOG.info(f"    {line}")
-            else:
-                LOG.info(f"{prefix} reth.log: no relayer-related lines found ({len(lines)} total lines)")
-        else:
-            LOG.info(f"{prefix} execution_logs: no reth.log files found")
+    try:
+        if not verbose:
+            exec_log_dir.stat()
+            return
+        reth_log = _latest_reth_log(exec_log_dir)
+    except FileNotFoundError:
+        LOG.warning("%s execution_logs dir NOT FOUND at %s", prefix, exec_log_dir)
+        return
+    if reth_log is not None:
+        # Filter for relayer-related lines
+        try:
+            tail, scanned = _tail_lines(
+                reth_log, tail_lines, keep=lambda l: _RELAYER_LOG_LINE_RE.search(l.lower()) is not None
+            )
+        except FileNotFoundError:
+            reth_log = None  # removed between the scan and the read
+    if reth_log is None:
+        LOG.info("%s execution_logs: no reth.log files found", prefix)
+        return
+    if tail:
+        LOG.info("%s reth.log relayer lines (last %d):", prefix, len(tail))
+        for line in tail:
+            LOG.info("    %s", line)
     else:
-        LOG.warning(f"{prefix} execution_logs dir NOT FOUND at {exec_log_dir}")
+        LOG.info("%s reth.log: no relayer-related lines found (%d total lines)", prefix, scanned)
 
 
 # Markers
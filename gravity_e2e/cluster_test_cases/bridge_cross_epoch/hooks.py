@@ -10,14 +10,21 @@ pre_start:  Start MockAnvil on port 8546 AND preload ALL bridge events with
 post_stop:  Shut down MockAnvil.
 """
 
+import argparse
 import json
 import logging
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOG = logging.getLogger(__name__)
 
 _mock = None
+_E2E_ROOT = str(Path(__file__).resolve().parents[2])
 _METADATA_FILE = "mock_anvil_metadata.json"
 
 # Defaults
@@ -27,34 +34,34 @@ _DEFAULT_RECIPIENT = "0x6954476eAe13Bd072D9f19406A6B9543514f765C"
 _DEFAULT_SENDER = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
 
 
-def _parse_int_arg(pytest_args, name, default):
-    args = pytest_args or []
-    for i, arg in enumerate(args):
-        if arg == name and i + 1 < len(args):
-            return int(args[i + 1])
-    return default
+class _HookArgParser(argparse.ArgumentParser):
+    def error(self, message):
+        # argparse would print usage and exit(2); report the bad value instead
+        raise ValueError(f"[hook] {message}")
+
+
+# Picks our options out of the full pytest argv; accepts both "--opt N" and "--opt=N".
+_HOOK_PARSER = _HookArgParser(add_help=False, allow_abbrev=False)
+_HOOK_PARSER.add_argument("--bridge-count", type=int, default=_DEFAULT_BRIDGE_COUNT)
+_HOOK_PARSER.add_argument("--first-batch-fraction", type=float, default=0.5)
 
 
-def _parse_float_arg(pytest_args, name, default):
-    args = pytest_args or []
-    for i, arg in enumerate(args):
-        if arg == name and i + 1 < len(args):
-            return float(args[i + 1])
-    return default
+def _parse_hook_args(pytest_args) -> argparse.Namespace:
+    return _HOOK_PARSER.parse_known_args(pytest_args or [])[0]
 
 
 def pre_start(test_dir: Path, env: dict, pytest_args: list = None):
     """Start MockAnvil + preload all events but hide them until the test releases each batch."""
     global _mock
 
-    e2e_root = str(Path(__file__).resolve().parent.parent.parent)
-    if e2e_root not in sys.path:
-        sys.path.insert(0, e2e_root)
+    if _E2E_ROOT not in sys.path:
+        sys.path.insert(0, _E2E_ROOT)
 
     from gravity_e2e.utils.mock_anvil import MockAnvil, DEFAULT_PORTAL_ADDRESS
 
-    bridge_count = _parse_int_arg(pytest_args, "--bridge-count", _DEFAULT_BRIDGE_COUNT)
-    first_fraction = _parse_float_arg(pytest_args, "--first-batch-fraction", 0.5)
+    hook_args = _parse_hook_args(pytest_args)
+    bridge_count = hook_args.bridge_count
+    first_fraction = hook_args.first_batch_fraction
 
     LOG.info(
         f"[hook] Starting MockAnvil on port 8546, preloading {bridge_count} events "
@@ -94,7 +101,10 @@ def pre_start(test_dir: Path, env: dict, pytest_args: list = None):
         "second_batch_block": bridge_count,
     }
     metadata_path = test_dir / _METADATA_FILE
-    metadata_path.write_text(json.dumps(metadata, indent=2))
+    if orjson is not None:
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        metadata_path.write_text(json.dumps(metadata, indent=2))
     LOG.info(f"[hook] Wrote metadata to {metadata_path}")
 
 
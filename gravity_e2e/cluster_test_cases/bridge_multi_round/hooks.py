@@ -9,14 +9,21 @@ pre_start:  Start MockAnvil on port 8546 AND preload ALL bridge events with the
 post_stop:  Shut down MockAnvil.
 """
 
+import argparse
 import json
 import logging
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOG = logging.getLogger(__name__)
 
 _mock = None
+_E2E_ROOT = str(Path(__file__).resolve().parents[2])
 _METADATA_FILE = "mock_anvil_metadata.json"
 
 # Defaults
@@ -27,12 +34,20 @@ _DEFAULT_RECIPIENT = "0x6954476eAe13Bd072D9f19406A6B9543514f765C"
 _DEFAULT_SENDER = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
 
 
-def _parse_int_arg(pytest_args, name, default):
-    args = pytest_args or []
-    for i, arg in enumerate(args):
-        if arg == name and i + 1 < len(args):
-            return int(args[i + 1])
-    return default
+class _HookArgParser(argparse.ArgumentParser):
+    def error(self, message):
+        # argparse would print usage and exit(2); report the bad value instead
+        raise ValueError(f"[hook] {message}")
+
+
+# Picks our options out of the full pytest argv; accepts both "--opt N" and "--opt=N".
+_HOOK_PARSER = _HookArgParser(add_help=False, allow_abbrev=False)
+_HOOK_PARSER.add_argument("--bridge-count", type=int, default=_DEFAULT_BRIDGE_COUNT)
+_HOOK_PARSER.add_argument("--rounds", type=int, default=_DEFAULT_ROUNDS)
+
+
+def _parse_hook_args(pytest_args) -> argparse.Namespace:
+    return _HOOK_PARSER.parse_known_args(pytest_args or [])[0]
 
 
 def _split_rounds(total: int, rounds: int):
@@ -57,14 +72,14 @@ def pre_start(test_dir: Path, env: dict, pytest_args: list = None):
     """Start MockAnvil + preload all events but hide them until the test releases each round."""
     global _mock
 
-    e2e_root = str(Path(__file__).resolve().parent.parent.parent)
-    if e2e_root not in sys.path:
-        sys.path.insert(0, e2e_root)
+    if _E2E_ROOT not in sys.path:
+        sys.path.insert(0, _E2E_ROOT)
 
     from gravity_e2e.utils.mock_anvil import MockAnvil, DEFAULT_PORTAL_ADDRESS
 
-    bridge_count = _parse_int_arg(pytest_args, "--bridge-count", _DEFAULT_BRIDGE_COUNT)
-    rounds = _parse_int_arg(pytest_args, "--rounds", _DEFAULT_ROUNDS)
+    hook_args = _parse_hook_args(pytest_args)
+    bridge_count = hook_args.bridge_count
+    rounds = hook_args.rounds
     if rounds > bridge_count:
         LOG.warning(f"[hook] rounds={rounds} > bridge_count={bridge_count}; clamping rounds={bridge_count}")
         rounds = bridge_count
@@ -109,7 +124,10 @@ def pre_start(test_dir: Path, env: dict, pytest_args: list = None):
         "round_boundaries": round_boundaries,
     }
     metadata_path = test_dir / _METADATA_FILE
-    metadata_path.write_text(json.dumps(metadata, indent=2))
+    if orjson is not None:
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        metadata_path.write_text(json.dumps(metadata, indent=2))
     LOG.info(f"[hook] Wrote metadata to {metadata_path}")
 
 
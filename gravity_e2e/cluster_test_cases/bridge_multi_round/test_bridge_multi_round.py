@@ -16,6 +16,7 @@ Mechanism:
 """
 
 import asyncio
+import heapq
 import logging
 import time
 from pathlib import Path
@@ -121,7 +122,7 @@ async def test_bridge_multi_round_same_epoch(
         found = result["found_nonces"]
         LOG.info(
             f"  round {r} settled in {elapsed:.1f}s — found {len(found)}/{boundary}, "
-            f"missing={sorted(missing)[:10]}"
+            f"missing={heapq.nsmallest(10, missing)}"
         )
         assert len(missing) == 0, (
             f"Round {r}: {len(missing)} missing nonces (boundary={boundary})"
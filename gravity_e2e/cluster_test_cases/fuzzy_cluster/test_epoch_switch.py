@@ -12,7 +12,7 @@ import time
 import pytest
 from contextlib import AsyncExitStack
 from pathlib import Path
-from typing import Set
+from typing import List, Optional, Set
 
 from eth_abi import encode
 from eth_account import Account
@@ -29,6 +29,16 @@ LOG = logging.getLogger(__name__)
 # Set to 0 to run indefinitely until signal is received.
 FUZZY_TEST_DURATION = 1800
 
+# Seed for the join/leave choices. None picks one at random; it is logged so
+# a failing run can be replayed.
+FUZZY_TEST_SEED = None
+
+# Max blocks any node may trail the highest node by
+MAX_BLOCK_HEIGHT_GAP = 100
+
+# Poll period for epoch changes around the expected epoch boundary
+EPOCH_POLL_INTERVAL = 1.0
+
 # ── Permissionless-join governance setup ────────────────────────────
 # registerValidator/joinValidatorSet are gated on a governance-managed pool
 # whitelist unless permissionless join is enabled (defaults to off at
@@ -143,6 +153,15 @@ async def enable_permissionless_join(w3: Web3):
     LOG.info("Permissionless validator join enabled via governance")
 
 
+def _check_node_set(what: str, actual: Set[str], expected: Set[str]):
+    """Raise if the chain's node set differs, naming only the nodes that differ."""
+    if actual != expected:
+        raise RuntimeError(
+            f"{what} nodes diverge: missing={sorted(expected - actual)}, "
+            f"unexpected={sorted(actual - expected)}"
+        )
+
+
 class EpochSwitchTestContext:
     """
     Context for epoch switch test, using the declarative Cluster API.
@@ -151,32 +170,85 @@ class EpochSwitchTestContext:
         cluster: The Cluster instance to test against.
         duration: Test duration in seconds. Default is 1800s (30 minutes).
                   Set to 0 to run indefinitely until signal is received.
+        seed: Seed for the join/leave choices. None picks (and logs) one.
     """
 
-    def __init__(self, cluster: Cluster, duration: int = 1800):
+    def __init__(self, cluster: Cluster, duration: int = 1800, seed: Optional[int] = None):
         self.cluster = cluster
         self.duration = duration
         self.start_time = time.monotonic()
 
-        self.genesis_node_names = []
-        self.candidate_node_names = []
-        for node_name, node in cluster.nodes.items():
-            if node.role == NodeRole.GENESIS:
-                self.genesis_node_names.append(node_name)
-            elif node.role == NodeRole.VALIDATOR:
-                self.candidate_node_names.append(node_name)
+        if seed is None:
+            seed = random.randrange(2**32)
+        LOG.info(f"Fuzz seed: {seed}")
+        self._rng = random.Random(seed)
+
+        self.genesis_node_names = list(cluster.nodes_by_role[NodeRole.GENESIS])
+        self.candidate_node_names = list(cluster.nodes_by_role[NodeRole.VALIDATOR])
+        self._genesis_set = frozenset(self.genesis_node_names)
+        self._candidate_set = frozenset(self.candidate_node_names)
+        # Fixed node order for the height sweeps, resolved once up front
+        self._all_node_names = tuple(self.genesis_node_names + self.candidate_node_names)
+        self._all_nodes = tuple(cluster.nodes[name] for name in self._all_node_names)
+
+        first_genesis = self.cluster.nodes[self.genesis_node_names[0]]
+        self.web3 = first_genesis.w3
+        self.genesis_http_url = first_genesis.http_url
+        # One HTTP session for the whole run; opened and closed by async with
+        self.http_client = GravityHttpClient(self.genesis_http_url)
+
+        # Epoch length from genesis.toml, used to sleep through the quiet part
+        # of each epoch instead of polling throughout it
+        epoch_micros = cluster.genesis_config.get("genesis", {}).get("epoch_interval_micros")
+        self.epoch_interval = epoch_micros / 1_000_000 if epoch_micros else None
+
+        # The handlers only record which signal arrived; should_stop names it
+        # in the log from ordinary code
+        self._received_signum: Optional[int] = None
+        self._signal_logged = False
+        # Set alongside _received_signum so waits in the event loop wake at once
+        self._stop_requested = asyncio.Event()
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._loop_signals = []
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            # Prefer the loop's own handler: it runs as a plain callback on the
+            # loop, so the stop event is set without a C-level frame hop
+            if self._loop is not None:
+                try:
+                    self._loop.add_signal_handler(sig, self._on_signal, sig)
+                    self._loop_signals.append(sig)
+                    continue
+                except (NotImplementedError, RuntimeError):
+                    pass
+            signal.signal(sig, self.signal_handler)
+
+    def _on_signal(self, signum):
+        self._received_signum = signum
+        self._stop_requested.set()
+
+    def signal_handler(self, signum, frame):
+        self._received_signum = signum
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stop_requested.set)
 
-        first_genesis = self.genesis_node_names[0]
-        self.rpc_url = self.cluster.nodes[first_genesis].url
-        self.web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+    def remove_signal_handlers(self):
+        """Hand SIGTERM/SIGINT back to pytest once the test is done."""
+        for sig in self._loop_signals:
+            self._loop.remove_signal_handler(sig)
+        self._loop_signals = []
 
-        self._signal_received = False
-        signal.signal(signal.SIGTERM, self.signal_handler)
-        signal.signal(signal.SIGINT, self.signal_handler)
+    async def __aenter__(self):
+        await self.http_client.__aenter__()
+        return self
 
-    def signal_handler(self, signum, frame):
-        self._signal_received = True
-        LOG.info(f"Received signal {signal.Signals(signum).name}, stopping...")
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self.http_client.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.remove_signal_handlers()
 
     @property
     def elapsed_time(self) -> float:
@@ -192,39 +264,71 @@ class EpochSwitchTestContext:
         - A signal was received (SIGTERM or SIGINT)
         - Duration > 0 and elapsed time exceeds duration
         """
-        if self._signal_received:
+        if self._received_signum is not None:
+            if not self._signal_logged:
+                self._signal_logged = True
+                LOG.info(
+                    "Received signal %s, stopping...",
+                    signal.Signals(self._received_signum).name,
+                )
             return True
         if self.duration > 0 and self.elapsed_time >= self.duration:
             LOG.info(f"Test duration ({self.duration}s) reached, stopping...")
             return True
         return False
 
+    async def _unless_stopped(self, coro):
+        """
+        Await `coro`, abandoning it as soon as a signal arrives or the test
+        duration runs out. Returns its result, or None if it was abandoned.
+        """
+        task = asyncio.ensure_future(coro)
+        stopper = asyncio.ensure_future(self._stop_requested.wait())
+        remaining = self.duration - self.elapsed_time if self.duration > 0 else None
+        try:
+            await asyncio.wait(
+                {task, stopper},
+                timeout=remaining,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            stopper.cancel()
+        if task.done():
+            return task.result()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return None
+
+    def _pick_some(self, pool: List[str]) -> List[str]:
+        """Pick 1-3 distinct nodes from a non-empty pool."""
+        return self._rng.sample(pool, k=self._rng.randint(1, min(3, len(pool))))
+
     async def validator_join(self, node_name: str):
         """Join a node to the validator set using Cluster API."""
         await self.cluster.validator_join(
             node_id=node_name,
             moniker=node_name.upper(),
         )
-        LOG.info(f"✅ Validator {node_name} join command executed successfully")
+        LOG.info("✅ Validator %s join command executed successfully", node_name)
 
     async def validator_leave(self, node_name: str):
         """Remove a node from the validator set using Cluster API."""
         await self.cluster.validator_leave(node_id=node_name)
-        LOG.info(f"✅ Validator {node_name} leave command executed successfully")
+        LOG.info("✅ Validator %s leave command executed successfully", node_name)
 
     async def validator_list(self):
         """
         Get validator list from gravity node using Cluster API.
-        Returns:
-            active_node_names: set of node names in active validator set
-            pending_inactive_node_names: set of node names in pending inactive validator set
-            pending_active_node_names: set of node names in pending active validator set
+        Returns (read-only snapshots; they compare equal to plain sets):
+            active_node_names: frozenset of node names in active validator set
+            pending_inactive_node_names: frozenset of node names in pending inactive validator set
+            pending_active_node_names: frozenset of node names in pending active validator set
         """
         validator_set = await self.cluster.validator_list()
 
-        active_node_names = {n.id for n in validator_set.active}
-        pending_inactive_node_names = {n.id for n in validator_set.pending_inactive}
-        pending_active_node_names = {n.id for n in validator_set.pending_active}
+        active_node_names = frozenset(n.id for n in validator_set.active)
+        pending_inactive_node_names = frozenset(n.id for n in validator_set.pending_inactive)
+        pending_active_node_names = frozenset(n.id for n in validator_set.pending_active)
 
         return active_node_names, pending_inactive_node_names, pending_active_node_names
 
@@ -232,178 +336,159 @@ class EpochSwitchTestContext:
         """
         Fuzzy test: Continuously and randomly make nodes join and leave the validator set
         """
-        validator_set, pending_joins, pending_leaves = await self.validator_list()
-
-        # Get HTTP port from first node
-        first_node = list(self.cluster.nodes.values())[0]
-        # FIXME: derive http_port from config if available
-        # Initialize HTTP client
-        http_client = GravityHttpClient(
-            self.cluster.get_node(self.genesis_node_names[0]).http_url
-        )
-        async with http_client:
-            # Get initial epoch
-            try:
-                current_epoch = await http_client.get_current_epoch()
-                LOG.info(f"Initial epoch: {current_epoch}")
-            except Exception as e:
-                LOG.error(f"❌ Failed to get initial epoch: {e}")
-                # If unable to get initial epoch, raise error
-                raise RuntimeError(f"Failed to get epoch: {e}")
-
-            # Main loop: check stop signal
-            try:
-                while not self.should_stop:
-                    # Check for epoch switch every 10 seconds
-                    await asyncio.sleep(10)
-
-                    # Check if epoch switched
-                    try:
-                        new_epoch = await http_client.get_current_epoch()
-                    except Exception as e:
-                        LOG.warning(
-                            f"⚠️ Failed to get current epoch: {e}, skipping this check"
-                        )
-                        raise RuntimeError(f"Failed to get epoch: {e}")
+        # The fuzz loop tracks its expectations in these, so take mutable copies
+        validator_set, pending_joins, pending_leaves = map(set, await self.validator_list())
 
-                    if new_epoch == current_epoch:
-                        continue
+        # Get initial epoch
+        try:
+            current_epoch = await self.http_client.get_current_epoch()
+            LOG.info(f"Initial epoch: {current_epoch}")
+            # When the current epoch began; unknown for the initial one
+            epoch_started_at = None
+        except Exception as e:
+            LOG.error(f"❌ Failed to get initial epoch: {e}")
+            # If unable to get initial epoch, raise error
+            raise RuntimeError(f"Failed to get epoch: {e}")
 
-                    if new_epoch < current_epoch:
-                        raise RuntimeError(
-                            f"Epoch decreased from {current_epoch} to {new_epoch}"
-                        )
-                    elif new_epoch > current_epoch:
-                        LOG.info(f"Epoch switched from {current_epoch} to {new_epoch}")
-                        current_epoch = new_epoch
-
-                    # Add successfully joined nodes to validator_set
-                    validator_set.update(pending_joins)
-                    if pending_joins:
-                        LOG.info(f"Nodes {pending_joins} entered validator_set")
-
-                    # Remove successfully left nodes from validator_set
-                    validator_set.difference_update(pending_leaves)
-                    if pending_leaves:
-                        LOG.info(f"Nodes {pending_leaves} exited validator_set")
-
-                    actual_active_nodes, _, _ = await self.validator_list()
-                    if actual_active_nodes != validator_set:
-                        raise RuntimeError(
-                            f"Actual active nodes: {actual_active_nodes} != expected active nodes: {validator_set}"
+        # Main loop: check stop signal
+        try:
+            while not self.should_stop:
+                # Wait for the epoch switch: sleep until shortly before it
+                # is due, then poll, returning as soon as it lands
+                expected_in = None
+                if epoch_started_at is not None and self.epoch_interval:
+                    expected_in = self.epoch_interval - (
+                        time.monotonic() - epoch_started_at
+                    )
+                try:
+                    new_epoch = await self._unless_stopped(
+                        self.http_client.wait_for_epoch_change(
+                            current_epoch,
+                            poll_interval=EPOCH_POLL_INTERVAL,
+                            expected_in=expected_in,
                         )
+                    )
+                except Exception as e:
+                    LOG.warning(
+                        f"⚠️ Failed to get current epoch: {e}, skipping this check"
+                    )
+                    raise RuntimeError(f"Failed to get epoch: {e}")
+
+                if new_epoch is None:
+                    # Stop requested; the loop condition reports why
+                    continue
+                epoch_started_at = time.monotonic()
+
+                if new_epoch < current_epoch:
+                    raise RuntimeError(
+                        f"Epoch decreased from {current_epoch} to {new_epoch}"
+                    )
+                elif new_epoch > current_epoch:
+                    LOG.info("Epoch switched from %d to %d", current_epoch, new_epoch)
+                    current_epoch = new_epoch
+
+                # Add successfully joined nodes to validator_set
+                validator_set.update(pending_joins)
+                if pending_joins:
+                    LOG.info("Nodes %s entered validator_set", pending_joins)
+
+                # Remove successfully left nodes from validator_set
+                validator_set.difference_update(pending_leaves)
+                if pending_leaves:
+                    LOG.info("Nodes %s exited validator_set", pending_leaves)
+
+                # Read before this epoch's joins/leaves are submitted; the
+                # expected sets describe the chain as of the epoch switch
+                actual_active_nodes, pending_inactive_nodes, pending_active_nodes = (
+                    await self.validator_list()
+                )
+                _check_node_set("Active", actual_active_nodes, validator_set)
+
+                # Reset pending joins and leaves
+                pending_joins.clear()
+                pending_leaves.clear()
+
+                # Show current validator_set
+                LOG.info("Current validator_set: %s", validator_set)
+
+                # Perform random join and leave during each epoch
+                # Randomly select 1-3 candidate nodes to call validator join
+                # sorted() keeps sampling reproducible under a seed;
+                # set iteration order of str varies between runs
+                nodes_not_in_validator = sorted(self._candidate_set - validator_set)
+
+                if nodes_not_in_validator:
+                    nodes_to_join = self._pick_some(nodes_not_in_validator)
+
+                    # Each node signs with its own EVM account, so the
+                    # joins are independent and can run concurrently
+                    LOG.info(
+                        "Attempting to let nodes %s join validator set...", nodes_to_join
+                    )
+                    await asyncio.gather(
+                        *(self.validator_join(n) for n in nodes_to_join)
+                    )
+                    pending_joins.update(nodes_to_join)
+                    LOG.info(
+                        "✅ Nodes %s joined successfully, will enter validator_set in the next epoch",
+                        nodes_to_join,
+                    )
+                # Randomly select 1-3 candidate nodes to call validator leave
+                candidate_nodes_in_validator_set = sorted(
+                    validator_set - self._genesis_set
+                )
+                if candidate_nodes_in_validator_set:
+                    nodes_to_leave = self._pick_some(candidate_nodes_in_validator_set)
 
-                    # Reset pending joins and leaves
-                    pending_joins.clear()
-                    pending_leaves.clear()
-
-                    # Show current validator_set
-                    LOG.info(f"Current validator_set: {validator_set}")
-
-                    # Perform random join and leave during each epoch
-                    # Randomly select 1-3 candidate nodes to call validator join
-                    nodes_not_in_validator = [
-                        node
-                        for node in self.candidate_node_names
-                        if node not in validator_set
-                    ]
-
-                    if nodes_not_in_validator:
-                        # Randomly select 1-3 nodes
-                        if len(nodes_not_in_validator) > 1:
-                            num_joins = random.randint(
-                                1, min(3, len(nodes_not_in_validator))
-                            )
-                            nodes_to_join = random.sample(
-                                nodes_not_in_validator, num_joins
-                            )
-                        else:
-                            nodes_to_join = nodes_not_in_validator
-
-                        for node_name in nodes_to_join:
-                            LOG.info(
-                                f"Attempting to let node {node_name} join validator set..."
-                            )
-                            await self.validator_join(node_name)
-                            pending_joins.add(node_name)
-                            LOG.info(
-                                f"✅ Node {node_name} joined successfully, will enter validator_set in the next epoch"
-                            )
-                    # Randomly select 1-3 candidate nodes to call validator leave
-                    candidate_nodes_in_validator_set = [
-                        node
-                        for node in validator_set
-                        if node not in self.genesis_node_names
-                    ]
-                    if candidate_nodes_in_validator_set:
-                        # Randomly select 1-3 nodes
-                        if len(candidate_nodes_in_validator_set) > 1:
-                            num_leaves = random.randint(
-                                1, min(3, len(candidate_nodes_in_validator_set))
-                            )
-                            nodes_to_leave = random.sample(
-                                candidate_nodes_in_validator_set, num_leaves
-                            )
-                        else:
-                            nodes_to_leave = candidate_nodes_in_validator_set
-
-                        for node_name in nodes_to_leave:
-                            LOG.info(
-                                f"Attempting to let node {node_name} leave validator set..."
-                            )
-                            await self.validator_leave(node_name)
-                            pending_leaves.add(node_name)
-                            LOG.info(
-                                f"✅ Node {node_name} left successfully, will exit validator_set in the next epoch"
-                            )
+                    LOG.info(
+                        "Attempting to let nodes %s leave validator set...", nodes_to_leave
+                    )
+                    await asyncio.gather(
+                        *(self.validator_leave(n) for n in nodes_to_leave)
+                    )
+                    pending_leaves.update(nodes_to_leave)
+                    LOG.info(
+                        "✅ Nodes %s left successfully, will exit validator_set in the next epoch",
+                        nodes_to_leave,
+                    )
 
+                # The pending sets only change through the join/leave
+                # calls above, so re-read them only if any were issued
+                if pending_joins or pending_leaves:
                     _, pending_inactive_nodes, pending_active_nodes = (
                         await self.validator_list()
                     )
-                    if pending_inactive_nodes != pending_leaves:
-                        raise RuntimeError(
-                            f"Actual pending inactive nodes: {pending_inactive_nodes} != expected pending inactive nodes: {pending_leaves}"
-                        )
-                    if pending_active_nodes != pending_joins:
-                        raise RuntimeError(
-                            f"Actual pending active nodes: {pending_active_nodes} != expected pending active nodes: {pending_joins}"
-                        )
-            except Exception as e:
-                raise RuntimeError(f"Failed to fuzzy validator join and leave: {e}")
+                _check_node_set("Pending inactive", pending_inactive_nodes, pending_leaves)
+                _check_node_set("Pending active", pending_active_nodes, pending_joins)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fuzzy validator join and leave: {e}")
 
     async def check_node_block_height(self):
-        all_node_names = self.genesis_node_names + self.candidate_node_names
-
         try:
             while not self.should_stop:
-                await asyncio.sleep(10)
+                # Sleep 10s, waking early on a stop signal or duration end
+                if await self._unless_stopped(asyncio.sleep(10, True)) is None:
+                    continue
 
-                async def get_and_log_block_number(node_name):
-                    node = self.cluster.get_node(node_name)
-                    # Run sync web3 call in a thread to avoid blocking the loop
-                    block_height = await asyncio.to_thread(
-                        lambda: node.w3.eth.block_number
-                    )
-                    LOG.info(f"{node_name} block height: {block_height}")
-                    return block_height
-
-                block_heights = await asyncio.gather(
-                    *[
-                        get_and_log_block_number(node_name)
-                        for node_name in all_node_names
-                    ]
-                )
+                block_heights = await self.cluster.get_block_numbers(self._all_nodes)
+                for node_name, block_height in zip(self._all_node_names, block_heights):
+                    LOG.info("%s block height: %d", node_name, block_height)
                 max_block_height = max(block_heights)
-                LOG.info(f"Max block height: {max_block_height}")
-                is_gap_too_large = False
-                for node_name, block_height in zip(all_node_names, block_heights):
-                    if block_height + 100 < max_block_height:
-                        LOG.warning(
-                            f"{node_name} block height is too low: {block_height}"
-                        )
-                        is_gap_too_large = True
-                if is_gap_too_large:
-                    raise RuntimeError(f"Gap between node block heights is too large")
+                LOG.info("Max block height: %d", max_block_height)
+                floor = max_block_height - MAX_BLOCK_HEIGHT_GAP
+                lagging = [
+                    (node_name, block_height)
+                    for node_name, block_height in zip(self._all_node_names, block_heights)
+                    if block_height < floor
+                ]
+                for node_name, block_height in lagging:
+                    LOG.warning(
+                        "%s block height is too low: %d", node_name, block_height
+                    )
+                if lagging:
+                    raise RuntimeError(
+                        f"Gap between node block heights is too large: {lagging}"
+                    )
         except Exception as e:
             raise RuntimeError(f"Failed to check node block height: {e}")
 
@@ -429,43 +514,52 @@ async def test_epoch_switch(cluster: Cluster):
         LOG.info("Test duration: indefinite (until signal received)")
     LOG.info("=" * 70)
 
-    test_context = EpochSwitchTestContext(cluster, duration=FUZZY_TEST_DURATION)
-    try:
-        # Step 1: Ensure all nodes are running using declarative API
-        LOG.info("\n[Step 1] Ensuring all nodes are running (set_full_live)...")
-        assert await cluster.set_full_live(
-            timeout=120
-        ), "Failed to bring all nodes to RUNNING"
-
-        # Log current state
-        live_nodes = await cluster.get_live_nodes()
-        LOG.info(
-            f"✅ All {len(live_nodes)} nodes are RUNNING: {[n.id for n in live_nodes]}"
-        )
+    async with EpochSwitchTestContext(
+        cluster, duration=FUZZY_TEST_DURATION, seed=FUZZY_TEST_SEED
+    ) as test_context:
+        try:
+            # Step 1: Ensure all nodes are running using declarative API
+            LOG.info("\n[Step 1] Ensuring all nodes are running (set_full_live)...")
+            assert await cluster.set_full_live(
+                timeout=120
+            ), "Failed to bring all nodes to RUNNING"
+
+            # Log current state
+            live_nodes = await cluster.get_live_nodes()
+            LOG.info(
+                f"✅ All {len(live_nodes)} nodes are RUNNING: {[n.id for n in live_nodes]}"
+            )
+
+            # Step 2: Log candidate nodes info
+            LOG.info("\n[Step 2] Candidate nodes for fuzzy testing:")
+            for node_name in test_context.candidate_node_names:
+                node = cluster.get_node(node_name)
+                LOG.info(f"  {node_name}: role={node.role.value}")
+            LOG.info(f"✅ {len(test_context.candidate_node_names)} candidate nodes ready")
+
+            # Step 2.5: Enable permissionless join so dynamically created pools
+            # can register without a per-pool governance whitelist entry
+            LOG.info("\n[Step 2.5] Enabling permissionless validator join...")
+            await enable_permissionless_join(test_context.web3)
+
+            tasks = []
+            # Step 3: Fuzzy validator candidate nodes join and leave
+            LOG.info("\n[Step 3] Fuzzy validator candidate nodes join and leave...")
+            tasks.append(asyncio.create_task(test_context.fuzzy_validator_join_and_leave()))
+            # Step 4: Check node block height gap between all nodes
+            LOG.info("\n[Step 4] Checking node block height gap between all nodes...")
+            tasks.append(asyncio.create_task(test_context.check_node_block_height()))
+            # The first loop to fail cancels the other instead of leaving it
+            # running until its next check
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task in done:
+                task.result()
+
+            LOG.info("✅ Epoch switch test completed successfully")
 
-        # Step 2: Log candidate nodes info
-        LOG.info("\n[Step 2] Candidate nodes for fuzzy testing:")
-        for node_name in test_context.candidate_node_names:
-            node = cluster.get_node(node_name)
-            LOG.info(f"  {node_name}: role={node.role.value}")
-        LOG.info(f"✅ {len(test_context.candidate_node_names)} candidate nodes ready")
-
-        # Step 2.5: Enable permissionless join so dynamically created pools
-        # can register without a per-pool governance whitelist entry
-        LOG.info("\n[Step 2.5] Enabling permissionless validator join...")
-        await enable_permissionless_join(test_context.web3)
-
-        tasks = []
-        # Step 3: Fuzzy validator candidate nodes join and leave
-        LOG.info("\n[Step 3] Fuzzy validator candidate nodes join and leave...")
-        tasks.append(asyncio.create_task(test_context.fuzzy_validator_join_and_leave()))
-        # Step 4: Check node block height gap between all nodes
-        LOG.info("\n[Step 4] Checking node block height gap between all nodes...")
-        tasks.append(asyncio.create_task(test_context.check_node_block_height()))
-        await asyncio.gather(*tasks)
-
-        LOG.info("✅ Epoch switch test completed successfully")
-
-    except Exception as e:
-        LOG.error(f"❌ Test failed: {e}")
-        raise
+        except Exception as e:
+            LOG.error(f"❌ Test failed: {e}")
+            raise
@@ -16,16 +16,17 @@ Failover Long-Running Stability Test
 """
 
 import asyncio
+import codecs
+import functools
 import logging
 import os
 import random
 import re
 import signal
-import subprocess
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pytest
 from web3 import Web3
@@ -52,6 +53,9 @@ KILL_READY_MAX_GAP = int(os.environ.get("KILL_READY_MAX_GAP", "10"))
 # Time to wait for a restarted node to catch up (seconds)
 CATCHUP_TIMEOUT = 120
 
+# How long a fetched block height is reused by the other loops (seconds)
+HEIGHT_CACHE_TTL = 1.5
+
 # Interval between health checks (seconds)
 HEALTH_CHECK_INTERVAL = 10
 
@@ -70,6 +74,16 @@ BENCH_TARGET_TPS = int(os.environ.get("BENCH_TARGET_TPS", "1000"))
 BENCH_RESTART_COOLDOWN = 120  # seconds between bench restarts
 BENCH_MAX_RESTARTS = 5        # max bench restart attempts before giving up
 
+# How much of the bench log's tail is kept for progress parsing
+BENCH_LOG_TAIL_BYTES = 8192
+
+# txn_tracker table rows: │ Progress        ┆ 10/10 ┆ TPS           ┆ 0.6   │
+# One pass picks up every metric cell; later tables overwrite earlier ones
+BENCH_METRIC_RE = re.compile(
+    r'(?P<key>│ Progress|TPS|Pending Txns|Send Failures|Exec Failures)\s+┆\s+(?P<value>\S+)'
+)
+BENCH_FAUCET_LEVEL_RE = re.compile(r"faucet distribution for LEVEL (\d+)")
+
 
 @dataclass
 class FailoverStats:
@@ -117,6 +131,9 @@ class FailoverTestContext:
         self.stats = FailoverStats()
         self._signal_received = False
         self._error: Optional[Exception] = None
+        # Set on a signal or the first error so the loops' waits end at once
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
 
         # Separate validators and VFN nodes
         self.validator_nodes: List[Node] = []
@@ -128,15 +145,36 @@ class FailoverTestContext:
                 self.vfn_nodes.append(node)
 
         # Bench process handle
-        self._bench_proc: Optional[subprocess.Popen] = None
+        self._bench_proc: Optional[asyncio.subprocess.Process] = None
         self._bench_restart_count: int = 0
         self._bench_last_restart_time: float = 0.0
 
+        # Latest bench tracing log and its size when last seen
+        self._bench_log_latest: Optional[Path] = None
+        self._bench_log_latest_size: int = -1
+
+        # Incremental reader over the latest bench tracing log
+        self._bench_tail_path: Optional[Path] = None
+        self._bench_tail_fh = None
+        self._bench_tail_decoder = None
+        self._bench_tail_buf = ""
+
+        # node_id -> (time.monotonic() when fetched, height or -1); shared by
+        # the failover and health loops so overlapping sweeps reuse one RPC
+        self._height_cache: Dict[str, Tuple[float, int]] = {}
+        self._height_fetches: Dict[str, asyncio.Future] = {}
+
+        # node_id -> (PID, pidfd or None) taken after the test (re)started the
+        # node, so a force kill does not depend on the pid file still being
+        # there; on Linux the pidfd pins the process against PID reuse
+        self._pid_cache: Dict[str, Tuple[int, Optional[int]]] = {}
+
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
 
     def _signal_handler(self, signum, frame):
         self._signal_received = True
+        self._loop.call_soon_threadsafe(self._stop_event.set)
         LOG.info(f"🛑 Received {signal.Signals(signum).name}, stopping gracefully...")
 
     @property
@@ -153,6 +191,16 @@ class FailoverTestContext:
     def _set_error(self, e: Exception):
         if self._error is None:
             self._error = e
+        self._stop_event.set()
+
+    async def _sleep_unless_stopped(self, seconds: float):
+        """Sleep up to `seconds`, returning early once the test should stop."""
+        if self.duration > 0:
+            seconds = min(seconds, max(0.0, self.duration - self.stats.elapsed))
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
 
     # ── Bench Management ─────────────────────────────────────────────
 
@@ -193,13 +241,13 @@ class FailoverTestContext:
             except OSError as e:
                 LOG.debug(f"  Failed to remove {old.name}: {e}")
 
-    def start_bench(self):
+    async def start_bench(self):
         """
         Start gravity_bench as a background subprocess.
         Bench stdout/stderr is redirected to a log file for analysis.
         """
-        # Clean up previous bench resources first (avoid file handle leaks)
-        self.stop_bench()
+        # Stop any previous bench first so only one writes load at a time
+        await self.stop_bench()
 
         # bench_config.toml lives alongside cluster.toml
         config_path = self.cluster.config_path.parent / "bench_config.toml"
@@ -218,10 +266,10 @@ class FailoverTestContext:
 
         # Clean old tracing logs before starting
         self._cleanup_old_bench_logs(keep=3)
+        self._bench_log_latest = None
 
         # Set up stdout log file (captures println! output)
         self._bench_log_path = self._setup_bench_log()
-        self._bench_log_file = open(self._bench_log_path, "w")
 
         LOG.info(f"🏋️ Starting gravity_bench...")
         LOG.info(f"   Config: {config_path}")
@@ -231,57 +279,114 @@ class FailoverTestContext:
         env = os.environ.copy()
         env["RUST_LOG"] = env.get("RUST_LOG", "info")
 
+        # A bare fd: the child writes its output straight to the file and
+        # keeps its own copy, so ours is closed as soon as it has spawned
+        log_fd = os.open(
+            self._bench_log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+        )
         try:
-            self._bench_proc = subprocess.Popen(
-                [
-                    "cargo", "run", "--release", "--quiet", "--",
-                    "--config", str(config_path),
-                ],
+            # Spawned through the event loop so a slow launch does not stall
+            # the failover and health-check loops
+            self._bench_proc = await asyncio.create_subprocess_exec(
+                "cargo", "run", "--release", "--quiet", "--",
+                "--config", str(config_path),
                 cwd=str(bench_dir),
                 env=env,
-                stdout=self._bench_log_file,
-                stderr=subprocess.STDOUT,
+                stdout=log_fd,
+                stderr=asyncio.subprocess.STDOUT,
             )
             LOG.info(f"🏋️ Bench started (PID={self._bench_proc.pid})")
         except Exception as e:
             LOG.error(f"❌ Failed to start bench: {e}")
-            self._bench_log_file.close()
-            self._bench_log_file = None
+        finally:
+            os.close(log_fd)
 
-    def stop_bench(self):
+    async def stop_bench(self):
         """Stop the bench subprocess if running."""
         if self._bench_proc is None:
             return
 
         LOG.info("🏋️ Stopping bench...")
         try:
-            self._bench_proc.terminate()
-            try:
-                self._bench_proc.wait(timeout=10)
-            except subprocess.TimeoutExpired:
-                self._bench_proc.kill()
-                self._bench_proc.wait(timeout=5)
+            if self._bench_proc.returncode is None:
+                self._bench_proc.terminate()
+                try:
+                    await asyncio.wait_for(self._bench_proc.wait(), timeout=10)
+                except asyncio.TimeoutError:
+                    self._bench_proc.kill()
+                    await asyncio.wait_for(self._bench_proc.wait(), timeout=5)
             LOG.info("🏋️ Bench stopped")
         except Exception as e:
             LOG.warning(f"⚠️  Error stopping bench: {e}")
         finally:
             self._bench_proc = None
-            if hasattr(self, "_bench_log_file") and self._bench_log_file:
-                self._bench_log_file.close()
-                self._bench_log_file = None
+            self._close_bench_log_tail()
 
     def check_bench_alive(self) -> bool:
         """Check if the bench subprocess is still running."""
         if self._bench_proc is None:
             return False
-        return self._bench_proc.poll() is None
+        return self._bench_proc.returncode is None
 
     def _find_bench_log(self) -> Optional[Path]:
-        """Find the latest bench tracing log file (log.*.log) in _bench_dir."""
+        """
+        Find the latest bench tracing log file (log.*.log) in _bench_dir.
+
+        The previous result is reused while it keeps growing: bench is still
+        writing it, so no newer file can exist. Only a quiet or vanished
+        file, as after a rotation or restart, triggers a fresh glob.
+        """
         if not hasattr(self, "_bench_dir") or not self._bench_dir:
             return None
-        logs = sorted(self._bench_dir.glob("log.*.log"), key=lambda p: p.stat().st_mtime)
-        return logs[-1] if logs else None
+        latest = self._bench_log_latest
+        if latest is not None:
+            try:
+                size = latest.stat().st_size
+            except OSError:
+                size = -1
+            if size > self._bench_log_latest_size:
+                self._bench_log_latest_size = size
+                return latest
+        logs = list(self._bench_dir.glob("log.*.log"))
+        latest = max(logs, key=lambda p: p.stat().st_mtime) if logs else None
+        self._bench_log_latest = latest
+        self._bench_log_latest_size = latest.stat().st_size if latest else -1
+        return latest
+
+    def _read_bench_log_tail(self, log_file: Path, file_size: int) -> str:
+        """
+        Return the last ~BENCH_LOG_TAIL_BYTES of `log_file`, reading only what
+        was appended since the previous call, and never more than
+        BENCH_LOG_TAIL_BYTES per call. Starts over when bench moves to a new
+        log file or the file shrinks.
+        """
+        fh = self._bench_tail_fh
+        if self._bench_tail_path != log_file or fh is None or file_size < fh.tell():
+            self._close_bench_log_tail()
+            fh = open(log_file, "rb")
+            self._bench_tail_fh = fh
+            self._bench_tail_path = log_file
+        if fh.tell() == 0 or file_size - fh.tell() > BENCH_LOG_TAIL_BYTES:
+            # New file, or more was appended than the window keeps: skip
+            # straight to the tail instead of reading the backlog
+            fh.seek(max(0, file_size - BENCH_LOG_TAIL_BYTES))
+            self._bench_tail_buf = ""
+            # Incremental so a character split across reads decodes intact
+            self._bench_tail_decoder = codecs.getincrementaldecoder("utf-8")(
+                errors="replace"
+            )
+        chunk = fh.read(file_size - fh.tell())
+        if chunk:
+            text = self._bench_tail_decoder.decode(chunk)
+            self._bench_tail_buf = (self._bench_tail_buf + text)[-BENCH_LOG_TAIL_BYTES:]
+        return self._bench_tail_buf
+
+    def _close_bench_log_tail(self):
+        if self._bench_tail_fh is not None:
+            self._bench_tail_fh.close()
+        self._bench_tail_fh = None
+        self._bench_tail_path = None
+        self._bench_tail_buf = ""
 
     def check_bench_progress(self) -> Optional[str]:
         """
@@ -298,12 +403,7 @@ class FailoverTestContext:
             if file_size == 0:
                 return "log empty"
 
-            # Read last 8KB for the most recent table
-            read_bytes = min(file_size, 8192)
-            with open(log_file, "r", errors="replace") as f:
-                if file_size > read_bytes:
-                    f.seek(file_size - read_bytes)
-                tail = f.read()
+            tail = self._read_bench_log_tail(log_file, file_size)
 
             # Determine phase
             phase = "starting"
@@ -312,25 +412,20 @@ class FailoverTestContext:
             elif "bench erc20 transfer" in tail or "bench uniswap" in tail:
                 phase = "TX"
             elif "faucet distribution" in tail:
-                levels = re.findall(r"faucet distribution for LEVEL (\d+)", tail)
+                levels = BENCH_FAUCET_LEVEL_RE.findall(tail)
                 phase = f"faucet-L{levels[-1]}" if levels else "faucet"
             elif "Starting in" in tail:
                 phase = "init"
 
             # Extract metrics from the LAST txn_tracker table
-            # Table rows: │ Progress        ┆ 10/10 ┆ TPS           ┆ 0.6   │
-            progress = tps = pending = send_fail = exec_fail = None
-
-            for m in re.finditer(r'│ Progress\s+┆\s+(\S+)', tail):
-                progress = m.group(1)
-            for m in re.finditer(r'TPS\s+┆\s+(\S+)', tail):
-                tps = m.group(1)
-            for m in re.finditer(r'Pending Txns\s+┆\s+(\S+)', tail):
-                pending = m.group(1)
-            for m in re.finditer(r'Send Failures\s+┆\s+(\S+)', tail):
-                send_fail = m.group(1)
-            for m in re.finditer(r'Exec Failures\s+┆\s+(\S+)', tail):
-                exec_fail = m.group(1)
+            metrics = {}
+            for m in BENCH_METRIC_RE.finditer(tail):
+                metrics[m.group("key")] = m.group("value")
+            progress = metrics.get("│ Progress")
+            tps = metrics.get("TPS")
+            pending = metrics.get("Pending Txns")
+            send_fail = metrics.get("Send Failures")
+            exec_fail = metrics.get("Exec Failures")
 
             if progress is not None:
                 parts = [f"phase={phase}", f"progress={progress}"]
@@ -362,11 +457,12 @@ class FailoverTestContext:
                 LOG.info(f"{'='*60}")
 
                 # Get currently running validators
-                live_validators = []
-                for node in self.validator_nodes:
-                    state, _ = await node.get_state()
-                    if state == NodeState.RUNNING:
-                        live_validators.append(node)
+                states = await self._get_states(self.validator_nodes)
+                live_validators = [
+                    node
+                    for node, state in zip(self.validator_nodes, states)
+                    if state == NodeState.RUNNING
+                ]
 
                 LOG.info(
                     f"Live validators: {[n.id for n in live_validators]} "
@@ -385,12 +481,7 @@ class FailoverTestContext:
                 # Check that no live validator is severely lagging
                 # before killing — a lagging node is effectively unusable,
                 # so killing another could drop us below BFT threshold
-                live_heights = {}
-                for node in live_validators:
-                    try:
-                        live_heights[node.id] = node.get_block_number()
-                    except Exception:
-                        live_heights[node.id] = -1
+                live_heights = await self._get_heights(live_validators)
 
                 responsive_heights = {
                     nid: h for nid, h in live_heights.items() if h >= 0
@@ -429,28 +520,23 @@ class FailoverTestContext:
 
                 # Verify the node is truly dead
                 await self._verify_node_stopped(victim)
-
-                # Log remaining
-                remaining = []
-                for node in self.validator_nodes:
-                    state, _ = await node.get_state()
-                    if state == NodeState.RUNNING:
-                        remaining.append(node.id)
-                LOG.info(f"Remaining validators: {remaining}")
+                self._invalidate_height(victim)
+                self._forget_pid(victim.id)
 
                 # Log bench status (restart is handled in health_check_loop with cooldown)
                 if self._bench_proc:
                     bench_ok = self.check_bench_alive()
                     LOG.info(f"🏋️ Bench alive: {bench_ok}")
 
-                # Wait random downtime
+                # Wait random downtime; the remaining-validator sweep is pure
+                # reads, so it runs inside the downtime rather than before it
                 down_time = random.uniform(DOWN_TIME_MIN, DOWN_TIME_MAX)
                 LOG.info(f"⏳ {victim.id} will be down for {down_time:.1f}s...")
 
-                waited = 0.0
-                while waited < down_time and not self.should_stop:
-                    await asyncio.sleep(min(2.0, down_time - waited))
-                    waited += 2.0
+                await asyncio.gather(
+                    self._log_remaining_validators(),
+                    self._sleep_unless_stopped(down_time),
+                )
 
                 if self.should_stop:
                     LOG.info(f"🔄 Recovering {victim.id} before exit...")
@@ -472,6 +558,9 @@ class FailoverTestContext:
                         )
                         return
 
+                self._invalidate_height(victim)
+                await self._remember_pid(victim)
+
                 # Wait for catch-up
                 LOG.info(
                     f"⏳ Waiting for {victim.id} to catch up "
@@ -486,16 +575,14 @@ class FailoverTestContext:
                 else:
                     LOG.info(f"✅ {victim.id} caught up successfully")
 
-                await self._log_all_heights()
-
-                # Interval before next round
+                # Interval before next round, with the height report inside it
                 interval = random.uniform(FAILOVER_INTERVAL_MIN, FAILOVER_INTERVAL_MAX)
                 LOG.info(f"💤 Sleeping {interval:.1f}s before next round...")
 
-                waited = 0.0
-                while waited < interval and not self.should_stop:
-                    await asyncio.sleep(min(2.0, interval - waited))
-                    waited += 2.0
+                await asyncio.gather(
+                    self._log_all_heights(),
+                    self._sleep_unless_stopped(interval),
+                )
 
         except Exception as e:
             LOG.error(f"❌ Failover loop error: {e}")
@@ -505,26 +592,22 @@ class FailoverTestContext:
     async def _wait_for_catchup(self, node: Node) -> bool:
         """Wait for a node to catch up to within acceptable gap."""
         start = time.monotonic()
+        # Most restarts catch up quickly: poll at the height cache's pace
+        # first, backing off to every 3s for slow ones
+        delay = HEIGHT_CACHE_TTL
         while time.monotonic() - start < CATCHUP_TIMEOUT:
             if self.should_stop:
                 return True
 
-            try:
-                node_height = node.get_block_number()
-            except Exception:
-                await asyncio.sleep(2)
+            heights = await self._get_heights(self.cluster.nodes.values())
+            node_height = heights.pop(node.id)
+            if node_height < 0:
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.5, 3.0)
                 continue
 
-            # Get max height from other running nodes (validators + VFN)
-            max_height = 0
-            for other in self.cluster.nodes.values():
-                if other.id == node.id:
-                    continue
-                try:
-                    h = other.get_block_number()
-                    max_height = max(max_height, h)
-                except Exception:
-                    pass
+            # Max height from the other running nodes (validators + VFN)
+            max_height = max([0, *heights.values()])
 
             gap = max_height - node_height
             if gap <= MAX_BLOCK_GAP // 2:
@@ -537,34 +620,81 @@ class FailoverTestContext:
                 f"  {node.id} catching up: height={node_height}, "
                 f"max={max_height}, gap={gap}"
             )
-            await asyncio.sleep(3)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 3.0)
 
         return False
 
     async def _recover_validators(self):
         """Bring all stopped validators back online."""
-        for node in self.validator_nodes:
-            state, _ = await node.get_state()
+        states = await self._get_states(self.validator_nodes)
+        for node, state in zip(self.validator_nodes, states):
             if state != NodeState.RUNNING:
                 LOG.info(f"🔄 Recovering {node.id} (state={state.name})...")
                 await node.start()
+                self._invalidate_height(node)
+                await self._remember_pid(node)
+
+    async def _read_pid(self, node: Node) -> Optional[int]:
+        """Read the node's PID file in a worker thread; None if absent or bad."""
+        try:
+            return int((await asyncio.to_thread(node.pid_file.read_text)).strip())
+        except (ValueError, OSError):
+            return None
+
+    async def _remember_pid(self, node: Node):
+        self._forget_pid(node.id)
+        pid = await self._read_pid(node)
+        if pid is None:
+            return
+        pidfd = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                return
+            except OSError:
+                pass  # kernel without pidfd support (< 5.3): plain PID
+        self._pid_cache[node.id] = (pid, pidfd)
+
+    def _forget_pid(self, node_id: str):
+        entry = self._pid_cache.pop(node_id, None)
+        if entry is not None and entry[1] is not None:
+            os.close(entry[1])
+
+    def close_pidfds(self):
+        """Release the pidfds held for force kills."""
+        for node_id in list(self._pid_cache):
+            self._forget_pid(node_id)
 
     async def _force_kill_node(self, node: Node):
         """
         Force kill a node by sending SIGKILL to its PID.
         Used when graceful stop fails.
         """
-        if not node.pid_file.exists():
+        entry = self._pid_cache.pop(node.id, None)
+        if entry is not None:
+            pid, pidfd = entry
+        else:
+            pid, pidfd = await self._read_pid(node), None
+        if pid is None:
             LOG.warning(f"  No PID file for {node.id}, cannot force kill")
             return
         try:
-            pid = int(node.pid_file.read_text().strip())
             LOG.warning(f"  Sending SIGKILL to {node.id} (PID={pid})...")
-            os.kill(pid, signal.SIGKILL)
+            if pidfd is not None:
+                signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+            else:
+                os.kill(pid, signal.SIGKILL)
+            # Killed behind Node.stop(): drop cached block-progress results
+            node.lifecycle_changed_at = time.monotonic()
             await asyncio.sleep(1)
             node.pid_file.unlink(missing_ok=True)
-        except (ValueError, ProcessLookupError, OSError) as e:
+        except (ProcessLookupError, OSError) as e:
             LOG.info(f"  {node.id} PID already gone: {e}")
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
 
     async def _verify_node_stopped(
         self, node: Node, timeout: float = 10.0
@@ -575,13 +705,16 @@ class FailoverTestContext:
         Returns True if confirmed stopped, False if still alive.
         """
         start = time.monotonic()
+        # Usually already down right after stop(); poll fast, then back off
+        delay = 0.02
         while time.monotonic() - start < timeout:
             state, _ = await node.get_state()
             if state == NodeState.STOPPED:
                 LOG.info(f"  ✓ {node.id} verified STOPPED")
                 return True
             LOG.debug(f"  {node.id} still {state.name}, waiting...")
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
 
         # Final check
         state, _ = await node.get_state()
@@ -598,13 +731,84 @@ class FailoverTestContext:
                 return False
         return True
 
+    async def _get_height(self, node: Node) -> int:
+        """
+        Block height of `node`, or -1 if it does not answer.
+
+        Reuses a height fetched within HEIGHT_CACHE_TTL, and joins a fetch
+        already in flight for the node instead of issuing a second RPC.
+        """
+        cached = self._height_cache.get(node.id)
+        if cached is not None and time.monotonic() - cached[0] < HEIGHT_CACHE_TTL:
+            return cached[1]
+        fetch = self._height_fetches.get(node.id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(asyncio.to_thread(node.get_block_number))
+            self._height_fetches[node.id] = fetch
+            fetch.add_done_callback(functools.partial(self._store_height, node.id))
+        try:
+            # Shielded: a cancelled caller must not cancel the shared fetch
+            return await asyncio.shield(fetch)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return -1
+
+    def _store_height(self, node_id: str, fetch: asyncio.Future):
+        # A fetch invalidated while in flight must not repopulate the cache
+        if self._height_fetches.get(node_id) is not fetch:
+            return
+        del self._height_fetches[node_id]
+        if fetch.cancelled():
+            return
+        height = -1 if fetch.exception() is not None else fetch.result()
+        self._height_cache[node_id] = (time.monotonic(), height)
+
+    def _invalidate_height(self, node: Node):
+        """Forget a node's height after it was stopped or (re)started."""
+        self._height_cache.pop(node.id, None)
+        self._height_fetches.pop(node.id, None)
+
+    async def _get_heights(self, nodes: Iterable[Node]) -> Dict[str, int]:
+        """Block heights of `nodes`, fetched concurrently, keyed by node id."""
+        nodes = list(nodes)
+        heights = await asyncio.gather(*(self._get_height(node) for node in nodes))
+        return {node.id: h for node, h in zip(nodes, heights)}
+
+    async def _get_state(self, node: Node) -> NodeState:
+        """
+        State of `node`, sharing the height cache with the height sweeps.
+
+        A node with a fresh cached height answered RPC, which is exactly what
+        makes it RUNNING, so it is not probed again. Otherwise the probe runs
+        in a worker thread and its height is cached for the other loop.
+        """
+        cached = self._height_cache.get(node.id)
+        if (
+            cached is not None
+            and cached[1] >= 0
+            and time.monotonic() - cached[0] < HEIGHT_CACHE_TTL
+        ):
+            return NodeState.RUNNING
+        state, height = await asyncio.to_thread(node.probe_state)
+        self._height_cache[node.id] = (time.monotonic(), height)
+        return state
+
+    async def _get_states(self, nodes: List[Node]) -> List[NodeState]:
+        """States of `nodes`, in order, probed concurrently."""
+        return list(await asyncio.gather(*(self._get_state(node) for node in nodes)))
+
+    async def _log_remaining_validators(self):
+        states = await self._get_states(self.validator_nodes)
+        remaining = [
+            node.id
+            for node, state in zip(self.validator_nodes, states)
+            if state == NodeState.RUNNING
+        ]
+        LOG.info(f"Remaining validators: {remaining}")
+
     async def _log_all_heights(self):
-        heights = {}
-        for nid, node in self.cluster.nodes.items():
-            try:
-                heights[nid] = node.get_block_number()
-            except Exception:
-                heights[nid] = -1
+        heights = await self._get_heights(self.cluster.nodes.values())
         LOG.info(f"📏 Block heights: {heights}")
 
     # ── Health Check Loop ────────────────────────────────────────────
@@ -622,16 +826,13 @@ class FailoverTestContext:
             stall_count = 0
 
             while not self.should_stop:
-                await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+                await self._sleep_unless_stopped(HEALTH_CHECK_INTERVAL)
+                if self.should_stop:
+                    break
                 self.stats.health_checks += 1
 
                 # Gather heights from all nodes
-                current_heights = {}
-                for nid, node in self.cluster.nodes.items():
-                    try:
-                        current_heights[nid] = node.get_block_number()
-                    except Exception:
-                        current_heights[nid] = -1
+                current_heights = await self._get_heights(self.cluster.nodes.values())
 
                 running_heights = {
                     nid: h for nid, h in current_heights.items() if h >= 0
@@ -753,7 +954,7 @@ class FailoverTestContext:
                                 f"⚠️  Bench died, restarting "
                                 f"(attempt {self._bench_restart_count}/{BENCH_MAX_RESTARTS})..."
                             )
-                            self.start_bench()
+                            await self.start_bench()
 
         except Exception as e:
             LOG.error(f"❌ Health check error: {e}")
@@ -819,7 +1020,7 @@ async def test_failover_stability(cluster: Cluster):
 
     # Step 3: Start bench
     LOG.info("\n[Step 3] Starting bench load...")
-    ctx.start_bench()
+    await ctx.start_bench()
     if ctx.check_bench_alive():
         LOG.info("✅ Bench is running")
     else:
@@ -832,22 +1033,29 @@ async def test_failover_stability(cluster: Cluster):
         asyncio.create_task(ctx.health_check_loop(), name="health_check"),
     ]
 
-    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
 
-    for t in pending:
-        t.cancel()
-        try:
-            await t
-        except asyncio.CancelledError:
-            pass
-
-    for t in done:
-        if t.exception() is not None:
-            LOG.error(f"Task {t.get_name()} failed: {t.exception()}")
+        for t in pending:
+            t.cancel()
+            try:
+                await t
+            except asyncio.CancelledError:
+                pass
+
+        for t in done:
+            if t.exception() is not None:
+                LOG.error(f"Task {t.get_name()} failed: {t.exception()}")
+    finally:
+        # Also reached on Ctrl-C / cancellation while waiting: stop the loops
+        # so none of them caches a new pidfd after we release the old ones
+        for t in tasks:
+            t.cancel()
+        ctx.close_pidfds()
 
     # Step 5: Cleanup
     LOG.info("\n[Step 5] Cleanup...")
-    ctx.stop_bench()
+    await ctx.stop_bench()
 
     LOG.info("Recovering all nodes...")
     await cluster.set_full_live(timeout=60)
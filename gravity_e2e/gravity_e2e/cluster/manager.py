@@ -12,12 +12,12 @@ import subprocess
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Sequence, Tuple
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 
-from .node import Node, NodeState, NodeRole
+from .node import BLOCK_POLL_INTERVAL, Node, NodeState, NodeRole
 
 LOG = logging.getLogger(__name__)
 
@@ -61,6 +61,10 @@ RETRYABLE_STAKING_ERRORS = (
 STAKING_RETRY_INTERVAL_SECS = 5
 STAKING_RETRY_BUDGET_SECS = 60
 
+# How long a successful check_block_increasing result is reused for the same
+# nodes, provided no node has been started or stopped since
+BLOCK_PROGRESS_CACHE_SECS = 5.0
+
 
 # Standard devnet keys (Anvil/Hardhat defaults)
 KNOWN_DEV_KEYS = [
@@ -98,6 +102,12 @@ class Cluster:
                 self.genesis_config = tomllib.load(f)
 
         self.nodes: Dict[str, Node] = self._discover_nodes()
+        # Node ids per role, in discovery order; every role has an entry
+        self.nodes_by_role: Dict[NodeRole, List[str]] = {role: [] for role in NodeRole}
+        for node_id, node in self.nodes.items():
+            self.nodes_by_role[node.role].append(node_id)
+        # node_id -> (time.monotonic() when progress was seen, blocks advanced)
+        self._progress_seen: Dict[str, Tuple[float, int]] = {}
 
         # Cluster control scripts
         self.start_script = self.cluster_root / "start.sh"
@@ -303,6 +313,7 @@ class Cluster:
                 http_port=http_port,
                 p2p_port=p2p_port,
                 vfn_port=vfn_port,
+                ws_port=node_cfg.get("ws_port"),
             )
         return nodes
 
@@ -365,6 +376,7 @@ class Cluster:
 
     async def start(self) -> bool:
         """Runs start.sh (starts all nodes)."""
+        self._progress_seen.clear()
         # start.sh takes --config argument
         return await self._run_script(
             self.start_script, ["--config", str(self.config_path)]
@@ -372,6 +384,7 @@ class Cluster:
 
     async def stop(self) -> bool:
         """Runs stop.sh (stops all nodes)."""
+        self._progress_seen.clear()
         return await self._run_script(
             self.stop_script, ["--config", str(self.config_path)]
         )
@@ -380,6 +393,26 @@ class Cluster:
         """Get a specific node handle."""
         return self.nodes.get(node_id)
 
+    async def get_block_numbers(self, nodes: Sequence[Node]) -> List[int]:
+        """
+        Fetch the block height of each node, in order, in one concurrent sweep.
+
+        Every node is its own RPC endpoint, so this is one eth_blockNumber per
+        node (a JSON-RPC batch cannot span endpoints). The calls go straight to
+        each provider, skipping web3's middleware, and run in worker threads
+        on the shared keep-alive pool. Raises the first RPC error.
+        """
+
+        def fetch(node: Node) -> int:
+            resp = node.w3.provider.make_request("eth_blockNumber", [])
+            if resp.get("error"):
+                raise RuntimeError(f"{node.id} eth_blockNumber failed: {resp['error']}")
+            return int(resp["result"], 16)
+
+        return list(
+            await asyncio.gather(*(asyncio.to_thread(fetch, node) for node in nodes))
+        )
+
     # ========== Declarative API ==========
 
     async def get_live_nodes(self) -> List[Node]:
@@ -609,22 +642,61 @@ class Cluster:
         LOG.error(f"Failed to set {node_id} to {target_state.name} within {timeout}s")
         return False
 
+    def _progress_recent(self, nodes: List[Node], delta: int) -> bool:
+        """True if every node advanced >= delta blocks within the cache window
+        and no node in the cluster has been started or stopped since."""
+        now = time.monotonic()
+        changed_at = max((n.lifecycle_changed_at for n in self.nodes.values()), default=0.0)
+        for n in nodes:
+            seen = self._progress_seen.get(n.id)
+            if seen is None:
+                return False
+            seen_at, seen_delta = seen
+            if seen_delta < delta or seen_at <= changed_at or now - seen_at > BLOCK_PROGRESS_CACHE_SECS:
+                return False
+        return True
+
+    def _record_progress(self, node: Node, delta: int) -> None:
+        self._progress_seen[node.id] = (time.monotonic(), delta)
+
     async def check_block_increasing(
-        self, node_id: Optional[str] = None, timeout: int = 30, delta: int = 1
+        self,
+        node_id: Optional[str] = None,
+        timeout: int = 30,
+        delta: int = 1,
+        cache: bool = False,
+        poll_interval: float = BLOCK_POLL_INTERVAL,
     ) -> bool:
         """
         Check if block height is increasing.
         :param node_id: If specified, check only this node. If None, check ALL currently RUNNING nodes.
         :param timeout: Max time to wait for increase.
         :param delta: Minimum block increase expected.
+        :param cache: Accept a recent success instead of polling (see below).
+        :param poll_interval: Seconds between height polls on each node.
         :return: True if all unchecked nodes made progress.
+
+        With cache=True, a success is reused for BLOCK_PROGRESS_CACHE_SECS, as
+        long as the earlier check covered the same nodes with at least `delta`
+        blocks and no node has been started or stopped since. Only
+        Node.start()/stop() and Cluster.start()/stop() are seen as such
+        changes, so a check right after a fault injected any other way must
+        leave caching off (the default).
         """
         if node_id:
             node = self.get_node(node_id)
             if not node:
                 LOG.error(f"Node {node_id} not found")
                 return False
-            return await node.wait_for_block_increase(timeout=timeout, delta=delta)
+            if cache and self._progress_recent([node], delta):
+                LOG.info(f"Node {node_id} progress verified within the last {BLOCK_PROGRESS_CACHE_SECS:.0f}s")
+                return True
+            if await node.wait_for_block_increase(
+                timeout=timeout, delta=delta, poll_interval=poll_interval
+            ):
+                self._record_progress(node, delta)
+                return True
+            return False
         else:
             # Check all live nodes
             live_nodes = await self.get_live_nodes()
@@ -632,17 +704,30 @@ class Cluster:
                 LOG.warning("No live nodes to check progress for.")
                 return False
 
+            if cache and self._progress_recent(live_nodes, delta):
+                LOG.info(
+                    f"Block progress for {[n.id for n in live_nodes]} "
+                    f"verified within the last {BLOCK_PROGRESS_CACHE_SECS:.0f}s"
+                )
+                return True
+
             LOG.info(
                 f"Checking block progress for {len(live_nodes)} nodes: {[n.id for n in live_nodes]}"
             )
 
             results = await asyncio.gather(
                 *[
-                    n.wait_for_block_increase(timeout=timeout, delta=delta)
+                    n.wait_for_block_increase(
+                        timeout=timeout, delta=delta, poll_interval=poll_interval
+                    )
                     for n in live_nodes
                 ]
             )
 
+            for n, ok in zip(live_nodes, results):
+                if ok:
+                    self._record_progress(n, delta)
+
             success = all(results)
             if success:
                 LOG.info("All live nodes made progress.")
@@ -1,8 +1,11 @@
 import asyncio
 import logging
+import time
 from pathlib import Path
 from typing import Tuple, Dict, Any, Optional
 from enum import Enum, auto
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from eth_account.signers.local import LocalAccount
 
@@ -12,6 +15,17 @@ TransactionReceipt = Dict[str, Any]
 
 LOG = logging.getLogger(__name__)
 
+# One pooled HTTP session shared by every node's provider. Tests fan RPCs out
+# over worker threads; requests' default pool (10 per host) would otherwise
+# drop and re-open connections under that load.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Default height poll period for wait_for_block_increase. Callers that replace
+# a fixed sleep can pass a shorter poll_interval to return as soon as the
+# target height lands.
+BLOCK_POLL_INTERVAL = 1.0
+
 
 class NodeState(Enum):
     """Represents the lifecycle state of a node."""
@@ -64,12 +78,15 @@ class Node:
         vfn_port: int,
         stake_pool: Optional[str] = None,
         evm_account: Optional[LocalAccount] = None,
+        ws_port: Optional[int] = None,
     ):
         self.id = id
         self.rpc_port = rpc_port
         self.role = role  # Role from cluster.toml: GENESIS, VALIDATOR, or VFN
         self.url = f"http://127.0.0.1:{rpc_port}"
-        self.w3 = Web3(Web3.HTTPProvider(self.url))
+        self.w3 = Web3(Web3.HTTPProvider(self.url, session=_HTTP_SESSION))
+        # WebSocket RPC is optional (only deployed when ws_port is set in cluster.toml)
+        self.ws_url: Optional[str] = f"ws://127.0.0.1:{ws_port}" if ws_port else None
         self.http_port = http_port
         self.http_url = f"http://127.0.0.1:{http_port}"
         self.p2p_port = p2p_port
@@ -85,6 +102,9 @@ class Node:
         # Set/clear before calling start(); the child process inherits them
         # via subprocess env (passes through start.sh -> `env` -> gravity_node).
         self.extra_env: dict[str, str] = {}
+        # time.monotonic() of the last start()/stop() call; observations of
+        # chain progress made before it no longer describe the cluster.
+        self.lifecycle_changed_at: float = 0.0
 
         # Paths to control scripts
         self.start_script = self._infra_path / "script" / "start.sh"
@@ -164,6 +184,13 @@ class Node:
         Checks PID and RPC.
         Returns (State, BlockHeight). BlockHeight is -1 if not available.
         """
+        return self.probe_state()
+
+    def probe_state(self) -> Tuple[NodeState, int]:
+        """
+        Blocking form of get_state(), e.g. for probing several nodes
+        concurrently in worker threads.
+        """
         # 1. Check RPC first (most reliable for RUNNING)
         rpc_ok = False
         block_height = -1
@@ -189,6 +216,7 @@ class Node:
         Start this individual node.
         Returns True if node is now RUNNING.
         """
+        self.lifecycle_changed_at = time.monotonic()
         if not self.start_script.exists():
             LOG.warning(
                 f"Start script not found for {self.id} (remote node?). Cannot start."
@@ -282,6 +310,7 @@ class Node:
         *before* stop.sh runs and wait until the OS reports it gone so the
         next start does not race the RocksDB LOCK.
         """
+        self.lifecycle_changed_at = time.monotonic()
         if not self.stop_script.exists():
             LOG.warning(
                 f"Stop script not found for {self.id} (remote node?). Cannot stop."
@@ -347,7 +376,6 @@ class Node:
     async def _wait_for_pid_exit(self, pid: int, timeout: float = 50.0) -> bool:
         """Wait until ``pid`` is no longer alive (ProcessLookupError on kill 0)."""
         import os
-        import time
 
         deadline = time.monotonic() + timeout
         while time.monotonic() < deadline:
@@ -390,8 +418,6 @@ class Node:
         Also checks if the node process is still alive — if the process has crashed
         (e.g. port conflict), returns False immediately instead of waiting for timeout.
         """
-        import time
-
         start_time = time.time()
         while time.time() - start_time < timeout:
             # Fast-fail: if the process has died, no point waiting for RPC
@@ -412,13 +438,14 @@ class Node:
                 await asyncio.sleep(1)
         return False
 
-    async def wait_for_block_increase(self, timeout: int = 30, delta: int = 1) -> bool:
+    async def wait_for_block_increase(
+        self, timeout: int = 30, delta: int = 1, poll_interval: float = BLOCK_POLL_INTERVAL
+    ) -> bool:
         """
-        Wait for block number to increase by at least `delta`.
+        Wait for block number to increase by at least `delta`, polling every
+        `poll_interval` seconds.
         Returns True if progress observed, False if timeout.
         """
-        import time
-
         start_time = time.time()
 
         # Get start height
@@ -445,7 +472,7 @@ class Node:
             except Exception:
                 pass
 
-            await asyncio.sleep(1)
+            await asyncio.sleep(poll_interval)
 
         LOG.warning(
             f"Node {self.id} failed to produce {delta} blocks in {timeout}s (started at {start_height})"
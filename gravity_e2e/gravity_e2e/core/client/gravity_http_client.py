@@ -198,6 +198,51 @@ class GravityHttpClient:
         """
         latest_ledger_info = await self.get_latest_ledger_info()
         return latest_ledger_info["epoch"]
+
+
+    async def wait_for_epoch_change(
+        self,
+        current_epoch: int,
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        expected_in: Optional[float] = None,
+    ) -> int:
+        """
+        Wait until the epoch differs from `current_epoch`
+        
+        The node has no blocking endpoint for this, so it polls
+        latest_ledger_info. When the caller knows roughly when the switch is
+        due, `expected_in` lets it sleep through the quiet part of the epoch
+        and poll at `poll_interval` only around the boundary.
+        
+        Args:
+            current_epoch: Epoch to wait to move away from
+            timeout: Timeout (seconds), None to wait indefinitely
+            poll_interval: Seconds between polls
+            expected_in: Seconds until the switch is expected, if known
+        
+        Returns:
+            The new epoch number
+        
+        Raises:
+            TimeoutError: Timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if expected_in is not None and expected_in > poll_interval:
+            quiet = expected_in - poll_interval
+            if deadline is not None:
+                quiet = min(quiet, deadline - time.monotonic())
+            await asyncio.sleep(max(quiet, 0))
+
+        while True:
+            epoch = await self.get_current_epoch()
+            if epoch != current_epoch:
+                return epoch
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Epoch still {current_epoch} after {timeout}s"
+                )
+            await asyncio.sleep(poll_interval)
     
     async def get_ledger_info_by_epoch(self, epoch: int) -> Dict:
         """
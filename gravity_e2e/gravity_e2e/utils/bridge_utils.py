@@ -198,6 +198,55 @@ BATCH_BRIDGE_CALLER_BYTECODE = (
 # Default batch size for BatchBridgeCaller (bridges per transaction)
 BATCH_BRIDGE_CHUNK_SIZE = 100
 
+# eth_getBlockByNumber calls per JSON-RPC batch when fetching block timestamps
+BLOCK_TIMESTAMP_BATCH_SIZE = 100
+
+# Block window per eth_getLogs call when scanning Anvil for MessageSent, and
+# how many windows are fetched at once
+MESSAGE_SENT_LOG_WINDOW = 1000
+MESSAGE_SENT_LOG_WORKERS = 8
+
+
+def fetch_block_timestamps(
+    w3: Web3, block_numbers, batch_size: int = BLOCK_TIMESTAMP_BATCH_SIZE
+) -> Dict[int, int]:
+    """
+    Fetch the timestamp of each block in `block_numbers`.
+
+    Uses JSON-RPC batch requests (web3 >= 7) so N blocks cost
+    ceil(N / batch_size) round-trips instead of N. Falls back to one
+    get_block per block on older web3 or when a batch fails. Blocks that
+    cannot be fetched are left out of the result.
+
+    Returns:
+        Dict mapping block number to unix timestamp.
+    """
+    pending = sorted(set(block_numbers))
+    timestamps: Dict[int, int] = {}
+
+    if hasattr(w3, "batch_requests"):
+        for i in range(0, len(pending), batch_size):
+            chunk = pending[i:i + batch_size]
+            try:
+                with w3.batch_requests() as batch:
+                    for blk_num in chunk:
+                        batch.add(w3.eth.get_block(blk_num))
+                    blocks = batch.execute()
+            except Exception as e:
+                LOG.debug(f"  Batched get_block failed, fetching one by one: {e}")
+                continue
+            for blk_num, block in zip(chunk, blocks):
+                timestamps[blk_num] = block["timestamp"]
+
+    for blk_num in pending:
+        if blk_num in timestamps:
+            continue
+        try:
+            timestamps[blk_num] = w3.eth.get_block(blk_num)["timestamp"]
+        except Exception as e:
+            LOG.warning(f"  Failed to fetch block {blk_num} timestamp: {e}")
+    return timestamps
+
 
 
 # ============================================================================
@@ -399,12 +448,38 @@ class BridgeHelper:
 
         return list(range(1, count + 1))
 
-    def query_message_sent_events(self, from_block: int = 0) -> list:
-        """Query MessageSent events from GravityPortal on Anvil."""
-        logs = self.portal.events.MessageSent().get_logs(from_block=from_block)
-        return logs
+    def query_message_sent_events(
+        self, from_block: int = 0, to_block: Optional[int] = None
+    ) -> list:
+        """
+        Query MessageSent events from GravityPortal on Anvil.
 
-    def query_message_sent_timestamps(self, from_block: int = 0) -> Dict[int, int]:
+        The range (to_block defaults to the current head) is split into
+        MESSAGE_SENT_LOG_WINDOW-block eth_getLogs calls issued concurrently;
+        many small range scans beat one scan from genesis. Logs are returned
+        in block order.
+        """
+        if to_block is None:
+            to_block = self.w3.eth.block_number
+        windows = [
+            (lo, min(lo + MESSAGE_SENT_LOG_WINDOW - 1, to_block))
+            for lo in range(from_block, to_block + 1, MESSAGE_SENT_LOG_WINDOW)
+        ]
+        event = self.portal.events.MessageSent()
+
+        def fetch(window):
+            return event.get_logs(from_block=window[0], to_block=window[1])
+
+        if len(windows) <= 1:
+            return [log for window in windows for log in fetch(window)]
+        with ThreadPoolExecutor(
+            max_workers=min(len(windows), MESSAGE_SENT_LOG_WORKERS)
+        ) as pool:
+            return [log for logs in pool.map(fetch, windows) for log in logs]
+
+    def query_message_sent_timestamps(
+        self, from_block: int = 0, to_block: Optional[int] = None
+    ) -> Dict[int, int]:
         """
         Query MessageSent events and return a mapping of nonce → block timestamp.
 
@@ -415,19 +490,17 @@ class BridgeHelper:
             Dict mapping bridge nonce to the unix timestamp of the Anvil block
             in which the MessageSent event was emitted.
         """
-        events = self.query_message_sent_events(from_block=from_block)
-        nonce_to_timestamp: Dict[int, int] = {}
-        block_ts_cache: Dict[int, int] = {}  # block_number → timestamp
-
-        for evt in events:
-            block_num = evt["blockNumber"]
-            nonce_val = evt.args.nonce
-
-            if block_num not in block_ts_cache:
-                block = self.w3.eth.get_block(block_num)
-                block_ts_cache[block_num] = block["timestamp"]
-
-            nonce_to_timestamp[nonce_val] = block_ts_cache[block_num]
+        events = self.query_message_sent_events(
+            from_block=from_block, to_block=to_block
+        )
+        block_ts_cache = fetch_block_timestamps(
+            self.w3, (evt["blockNumber"] for evt in events)
+        )
+        nonce_to_timestamp: Dict[int, int] = {
+            evt.args.nonce: block_ts_cache[evt["blockNumber"]]
+            for evt in events
+            if evt["blockNumber"] in block_ts_cache
+        }
 
         LOG.info(
             f"  Fetched timestamps for {len(nonce_to_timestamp)} MessageSent events "
@@ -771,13 +844,7 @@ async def poll_all_native_minted(
         scan_from = scan_to + 1
 
     # Batch-fetch block timestamps for all unique gravity blocks
-    gravity_block_ts: Dict[int, int] = {}
-    for blk_num in gravity_block_numbers:
-        try:
-            block = gravity_w3.eth.get_block(blk_num)
-            gravity_block_ts[blk_num] = block["timestamp"]
-        except Exception as e:
-            LOG.warning(f"  Failed to fetch gravity block {blk_num} timestamp: {e}")
+    gravity_block_ts = fetch_block_timestamps(gravity_w3, gravity_block_numbers)
 
     # Enrich events with block_timestamp
     for evt in all_events:
@@ -823,6 +890,17 @@ class BridgeStats:
         self.nonces.append(nonce)
         self.total_bridged += amount
 
+    def record_bulk(
+        self, nonces: List[int], latencies: List[float], amount: int
+    ) -> None:
+        """Record many successful bridges of the same amount at once."""
+        count = len(latencies)
+        self.total += count
+        self.success += count
+        self.latencies.extend(latencies)
+        self.nonces.extend(nonces)
+        self.total_bridged += amount * count
+
     def record_failure(self) -> None:
         """Record a failed bridge iteration."""
         self.total += 1